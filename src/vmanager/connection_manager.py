@@ -9,6 +9,7 @@ from concurrent.futures import ThreadPoolExecutor, TimeoutError
 import libvirt
 
 from .constants import AppCacheTimeout
+from .libvirt_utils import forget_cached_hostname
 import time
 
 
@@ -237,6 +238,7 @@ class ConnectionManager:
             if uri in self.connections:
                 conn_to_close = self.connections[uri]
                 del self.connections[uri]
+        forget_cached_hostname(uri)
 
         if conn_to_close:
             try:
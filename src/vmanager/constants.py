@@ -1008,6 +1008,7 @@ class ErrorMessages:  # pylint: disable=too-few-public-methods
     FAILED_TO_CREATE_SSH_TUNNEL_GENERIC = _("Failed to create SSH tunnel...")
     PLEASE_SELECT_ACTION = _("Please select an action.")
     ERROR_SAVING_CONFIGURATION_TEMPLATE = _("Error saving configuration: {e}")
+    INVALID_INTEGER_SETTING_TEMPLATE = _("Invalid integer value for {setting}: '{value}'")
     ERROR_EXPORTING_XML_TEMPLATE = _("Error exporting XML: {error}")
     VALIDATION_ERROR_TEMPLATE = _("Validation error: {error}")
     INVALID_FORMAT_TEMPLATE = _("Invalid format: {error}")
@@ -3,6 +3,7 @@ Utility functions for libvirt XML parsing and common helpers.
 """
 
 import logging
+import threading
 import xml.etree.ElementTree as ET
 from functools import lru_cache
 from typing import Optional, Dict, List, Tuple, Any
@@ -12,6 +13,10 @@ import libvirt
 VIRTUI_MANAGER_NS = "http://github.com/aginies/virtui-manager"
 ET.register_namespace("virtui-manager", VIRTUI_MANAGER_NS)
 
+# Host names reported by libvirt, keyed by connection URI
+_hostname_cache: Dict[str, str] = {}
+_hostname_cache_lock = threading.Lock()
+
 
 def get_internal_id(domain: libvirt.virDomain, conn: Optional[libvirt.virConnect] = None) -> str:
     """
@@ -224,6 +229,36 @@ def get_cpu_models(conn: Optional[libvirt.virConnect], arch: str) -> List[str]:
         return []
 
 
+def get_cached_hostname(uri: str, conn: libvirt.virConnect) -> Optional[str]:
+    """Get the host name of a connection, querying libvirt only once per URI.
+
+    Args:
+        uri: The URI the connection was opened with
+        conn: The libvirt connection object
+
+    Returns:
+        The host name, or None if libvirt could not report it
+    """
+    with _hostname_cache_lock:
+        hostname = _hostname_cache.get(uri)
+    if hostname is not None:
+        return hostname
+    try:
+        hostname = conn.getHostname()
+    except libvirt.libvirtError:
+        # Not cached, so the next call retries
+        return None
+    with _hostname_cache_lock:
+        _hostname_cache[uri] = hostname
+    return hostname
+
+
+def forget_cached_hostname(uri: str) -> None:
+    """Drop the cached host name of a URI, e.g. when its connection is closed."""
+    with _hostname_cache_lock:
+        _hostname_cache.pop(uri, None)
+
+
 def get_host_resources(conn: libvirt.virConnect) -> Dict[str, Any]:
     """Retrieves host resource information (CPU, Memory).
 
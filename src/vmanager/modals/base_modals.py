@@ -5,10 +5,11 @@ Base Modal stuff
 import re
 from typing import Any, TypeVar
 
+from markdown_it import MarkdownIt
 from textual.screen import ModalScreen, Screen
-from textual.widgets import ListItem
+from textual.widgets import Button, ListItem, Markdown
 
-from ..constants import StaticText
+from ..constants import ButtonLabels, StaticText
 
 T = TypeVar("T")
 
@@ -21,6 +22,44 @@ class ValueListItem(ListItem):
         self.value = value
 
 
+class CachedMarkdownParser:
+    """
+    MarkdownIt front-end that parses each document only once per process.
+
+    Textual's Markdown widget re-parses its source every time it is mounted;
+    for static help texts the token stream never changes, so it is shared.
+    """
+
+    def __init__(self) -> None:
+        self._parser: MarkdownIt | None = None
+        self._tokens: dict[str, list] = {}
+
+    def parse(self, src: str, env: dict | None = None) -> list:
+        """Return the cached token stream for src, parsing it on first use."""
+        tokens = self._tokens.get(src)
+        if tokens is None:
+            if self._parser is None:
+                self._parser = MarkdownIt("gfm-like")
+            tokens = self._parser.parse(src, env)
+            self._tokens[src] = tokens
+        return tokens
+
+
+_markdown_parser = CachedMarkdownParser()
+
+
+class StaticMarkdown(Markdown):
+    """Markdown widget for static documents, sharing one caching parser."""
+
+    def __init__(self, markdown: str, **kwargs) -> None:
+        super().__init__(markdown, parser_factory=lambda: _markdown_parser, **kwargs)
+
+
+def close_button() -> Button:
+    """Return the standard primary "Close" button of the read-only modals."""
+    return Button(ButtonLabels.CLOSE, id="close-btn", variant="primary")
+
+
 class BaseModal(ModalScreen[T]):
     """Base class for all modal screens in the application."""
 
@@ -31,6 +70,21 @@ class BaseModal(ModalScreen[T]):
         self.dismiss(None)
 
 
+class CloseOnButtonModal(BaseModal[T]):
+    """
+    Base class for read-only modals that close on any button press.
+
+    The handler is defined once here and found through the MRO by every
+    subclass, instead of each modal declaring its own. It relies on the
+    on_button_pressed naming convention rather than an @on decorator, so
+    there is no selector registry to walk at dispatch time.
+    """
+
+    def on_button_pressed(self, _: Button.Pressed) -> None:
+        """Close the modal."""
+        self.dismiss(None)
+
+
 class BaseDialog(Screen[T]):
     """A base class for dialogs with a cancel binding."""
 
@@ -3,6 +3,7 @@ Modal for user configuration
 """
 
 import shutil
+from functools import lru_cache
 
 from textual import on
 from textual.app import ComposeResult
@@ -21,21 +22,62 @@ from ..constants import (
 from ..utils import check_r_viewer
 from .base_modals import BaseModal
 
+_LOG_LEVEL_CHOICES = (
+    ("DEBUG", "DEBUG"),
+    ("INFO", "INFO"),
+    ("WARNING", "WARNING"),
+    ("ERROR", "ERROR"),
+    ("CRITICAL", "CRITICAL"),
+)
+
+
+@lru_cache(maxsize=1)
+def _available_viewers() -> tuple:
+    """
+    Detect installed remote viewers once per process.
+
+    Returns:
+        tuple: (viewer options for the Select widget, auto-detected viewer)
+    """
+    viewers = tuple(
+        (viewer, viewer)
+        for viewer in ("virtui-remote-viewer", "virt-viewer")
+        if shutil.which(viewer)
+    )
+    auto_detected = check_r_viewer() if viewers else None
+    return viewers, auto_detected
+
+
+@lru_cache(maxsize=1)
+def _config_header_labels() -> tuple:
+    """Format the title and config path labels once per process."""
+    title = StaticText.CONFIGURATION_TITLE.format(namecase=AppInfo.namecase)
+    path_label = StaticText.EDITING_CONFIG_PATH.format(get_user_config_path=get_user_config_path())
+    return title, path_label
+
 
 class ConfigModal(BaseModal[None]):
     """Modal screen for configuring the application."""
 
+    # Integer settings: config key -> (input widget id, default)
+    INTEGER_SETTINGS = {
+        "STATS_INTERVAL": ("stats-interval-input", 5),
+        "WC_PORT_RANGE_START": ("wc-port-start-input", 40000),
+        "WC_PORT_RANGE_END": ("wc-port-end-input", 40050),
+        "VNC_QUALITY": ("vnc-quality-input", 0),
+        "VNC_COMPRESSION": ("vnc-compression-input", 9),
+    }
+
     def __init__(self, config: dict) -> None:
         super().__init__()
         self.config = config
+        self._viewer_select: Select | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the configuration modal UI."""
         with Vertical(id="config-dialog"):
-            title = StaticText.CONFIGURATION_TITLE.format(namecase=AppInfo.namecase)
+            title, path_label = _config_header_labels()
             yield Label(title, id="config-title")
-            config_path = get_user_config_path()
-            path_label = StaticText.EDITING_CONFIG_PATH.format(get_user_config_path=config_path)
             yield Label(path_label, id="config-title-file")
             with ScrollableContainer():
                 # Performance settings
@@ -59,24 +101,14 @@ class ConfigModal(BaseModal[None]):
 
                 yield Label(StaticText.LOGGING_LEVEL)
                 yield Select(
-                    [
-                        ("DEBUG", "DEBUG"),
-                        ("INFO", "INFO"),
-                        ("WARNING", "WARNING"),
-                        ("ERROR", "ERROR"),
-                        ("CRITICAL", "CRITICAL"),
-                    ],
+                    _LOG_LEVEL_CHOICES,
                     value=self.config.get("LOG_LEVEL") or "INFO",
                     id="log-level-select",
                     prompt=StaticText.LOG_LEVEL_PROMPT,
                 )
 
                 # Remote Viewer Settings
-                viewers = []
-                if shutil.which("virtui-remote-viewer"):
-                    viewers.append(("virtui-remote-viewer", "virtui-remote-viewer"))
-                if shutil.which("virt-viewer"):
-                    viewers.append(("virt-viewer", "virt-viewer"))
+                viewers, auto_detected = _available_viewers()
 
                 current_viewer = self.config.get("REMOTE_VIEWER")
                 if not current_viewer or current_viewer not in [v[1] for v in viewers]:
@@ -85,15 +117,15 @@ class ConfigModal(BaseModal[None]):
                 if not viewers:
                     yield Label(StaticText.NO_REMOTE_VIEWERS_FOUND)
                 else:
-                    auto_detected = check_r_viewer()
                     yield Label(StaticText.REMOTE_VIEWER_SELECT_LABEL.format(viewer=auto_detected))
-                    yield Select(
+                    self._viewer_select = Select(
                         viewers,
                         value=current_viewer,
                         id="remote-viewer-select",
                         allow_blank=True,
                         prompt=StaticText.REMOTE_VIEWER_PROMPT,
                     )
+                    yield self._viewer_select
 
                 # Web console settings
                 yield Label(StaticText.WEB_CONSOLE_NOVNC, classes="config-section-label")
@@ -153,50 +185,55 @@ class ConfigModal(BaseModal[None]):
                 yield Button(ButtonLabels.SAVE, variant="primary", id="save-config-btn")
                 yield Button(ButtonLabels.CANCEL, variant="default", id="cancel-btn")
 
+    def _int(self, widget_id: str, default: int) -> int:
+        """Read an integer input, falling back to default when it is empty."""
+        value = self.query_one(f"#{widget_id}", Input).value.strip()
+        return int(value) if value else default
+
     @on(Button.Pressed)
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
         if event.button.id == "save-config-btn":
-            try:
-                self.config["REMOTE_WEBCONSOLE"] = self.query_one(
-                    "#remote-webconsole-checkbox", Checkbox
-                ).value
-                self.config["websockify_path"] = self.query_one(
-                    "#websockify-path-input", Input
-                ).value
-                self.config["novnc_path"] = self.query_one("#novnc-path-input", Input).value
-                self.config["WC_PORT_RANGE_START"] = int(
-                    self.query_one("#wc-port-start-input", Input).value
-                )
-                self.config["WC_PORT_RANGE_END"] = int(
-                    self.query_one("#wc-port-end-input", Input).value
-                )
-                self.config["VNC_QUALITY"] = int(self.query_one("#vnc-quality-input", Input).value)
-                self.config["VNC_COMPRESSION"] = int(
-                    self.query_one("#vnc-compression-input", Input).value
-                )
-                self.config["STATS_INTERVAL"] = int(
-                    self.query_one("#stats-interval-input", Input).value
-                )
-                self.config["LOG_FILE_PATH"] = self.query_one("#log-file-path-input", Input).value
-                self.config["LOG_LEVEL"] = self.query_one("#log-level-select", Select).value
-
+            int_values = {}
+            for key, (widget_id, default) in self.INTEGER_SETTINGS.items():
                 try:
-                    viewer_select = self.query_one("#remote-viewer-select", Select)
-                    if viewer_select.value != Select.NULL:
-                        self.config["REMOTE_VIEWER"] = viewer_select.value
-                    else:
-                        self.config["REMOTE_VIEWER"] = None
-                        self.app.show_warning_message(WarningMessages.NO_REMOTE_VIEWER_SELECTED)
-                except LookupError:
-                    pass
+                    int_values[key] = self._int(widget_id, default)
+                except ValueError:
+                    value = self.query_one(f"#{widget_id}", Input).value
+                    self.app.show_error_message(
+                        ErrorMessages.INVALID_INTEGER_SETTING_TEMPLATE.format(
+                            setting=key, value=value
+                        )
+                    )
+                    return
+
+            self.config.update(int_values)
+            self.config["REMOTE_WEBCONSOLE"] = self.query_one(
+                "#remote-webconsole-checkbox", Checkbox
+            ).value
+            self.config["websockify_path"] = self.query_one("#websockify-path-input", Input).value
+            self.config["novnc_path"] = self.query_one("#novnc-path-input", Input).value
+            self.config["LOG_FILE_PATH"] = self.query_one("#log-file-path-input", Input).value
+            self.config["LOG_LEVEL"] = self.query_one("#log-level-select", Select).value
+
+            if self._viewer_select is not None:
+                old_viewer = self.config.get("REMOTE_VIEWER")
+                if self._viewer_select.value != Select.NULL:
+                    self.config["REMOTE_VIEWER"] = self._viewer_select.value
+                else:
+                    self.config["REMOTE_VIEWER"] = None
+                    self.app.show_warning_message(WarningMessages.NO_REMOTE_VIEWER_SELECTED)
+                if self.config["REMOTE_VIEWER"] != old_viewer:
+                    _available_viewers.cache_clear()
 
+            try:
                 save_config(self.config)
-                self.app.show_success_message(SuccessMessages.CONFIGURATION_SAVED)
-                self.dismiss(self.config)
-            except (ValueError, KeyError) as e:
+            except (OSError, ValueError) as e:
                 self.app.show_error_message(
                     ErrorMessages.ERROR_SAVING_CONFIGURATION_TEMPLATE.format(e=e)
                 )
+                return
+            self.app.show_success_message(SuccessMessages.CONFIGURATION_SAVED)
+            self.dismiss(self.config)
         elif event.button.id == "cancel-btn":
             self.dismiss(None)
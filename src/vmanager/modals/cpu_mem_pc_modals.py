@@ -2,6 +2,9 @@
 CPU MEM Machine type modals
 """
 
+import re
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.widgets import Button, Input, Label, ListView, Select
@@ -10,6 +13,22 @@ from ..constants import ButtonLabels, ErrorMessages, StaticText
 from .base_modals import BaseModal, ValueListItem
 from .utils_modals import InfoModal
 
+_CPUSET_RE = re.compile(r"^[0-9,\-]+$")
+_CPUTUNE_PART_RE = re.compile(r"^\s*(\d+)\s*:\s*([^:]*?)\s*$")
+
+_NUMA_MODES = (
+    ("strict", "strict"),
+    ("preferred", "preferred"),
+    ("interleave", "interleave"),
+    ("None", "None"),
+)
+
+
+@lru_cache(maxsize=8)
+def _cpu_pinning_label(max_vcpus: int) -> str:
+    """Format the CPU pinning prompt for a given vCPU count."""
+    return StaticText.ENTER_CPU_PINNING.format(max_vcpus=max_vcpus - 1)
+
 
 class EditCpuModal(BaseModal[str | None]):
     """Modal screen for editing VCPU count."""
@@ -117,7 +136,7 @@ class EditCpuTuneModal(BaseModal[list[dict] | None]):
         current_val = "; ".join([f"{p['vcpu']}:{p['cpuset']}" for p in self.current_vcpupin])
 
         with Vertical(id="edit-cpu-tune-dialog", classes="edit-cpu-dialog"):
-            yield Label(StaticText.ENTER_CPU_PINNING.format(max_vcpus=self.max_vcpus - 1))
+            yield Label(_cpu_pinning_label(self.max_vcpus))
             yield Label(StaticText.CPU_PINNING_FORMAT, classes="help-text")
             yield Input(
                 placeholder=StaticText.CPU_PINNING_EXAMPLE, id="cputune-input", value=current_val
@@ -132,37 +151,36 @@ class EditCpuTuneModal(BaseModal[list[dict] | None]):
             inp = self.query_one("#cputune-input", Input).value
             try:
                 vcpupin_list = []
-                if inp.strip():
-                    parts = inp.split(";")
-                    for part in parts:
-                        if ":" in part:
-                            vcpu, cpuset = part.split(":")
-                            vcpu = vcpu.strip()
-                            cpuset = cpuset.strip()
-
-                            # Validate vcpu is integer and within range
-                            vcpu_int = int(vcpu)
-                            if self.max_vcpus > 0 and vcpu_int >= self.max_vcpus:
-                                raise ValueError(
-                                    ErrorMessages.VCPU_EXCEEDS_MAX_TEMPLATE.format(
-                                        vcpu_int=vcpu_int, max_vcpus=self.max_vcpus
-                                    )
-                                )
-
-                            # Validate cpuset syntax (basic check)
-                            if not all(c.isdigit() or c in ",-" for c in cpuset):
-                                raise ValueError(
-                                    ErrorMessages.INVALID_CPUSET_SYNTAX_TEMPLATE.format(
-                                        cpuset=cpuset
-                                    )
-                                )
-
-                            vcpupin_list.append({"vcpu": vcpu, "cpuset": cpuset})
+                for part in inp.split(";"):
+                    if not part.strip():
+                        continue
+                    match = _CPUTUNE_PART_RE.match(part)
+                    if match is None:
+                        self.app.show_error_message(
+                            ErrorMessages.INVALID_FORMAT_TEMPLATE.format(error=part.strip())
+                        )
+                        return
+                    vcpu, cpuset = match.groups()
+
+                    # Validate vcpu is within range
+                    vcpu_int = int(vcpu)
+                    if self.max_vcpus > 0 and vcpu_int >= self.max_vcpus:
+                        raise ValueError(
+                            ErrorMessages.VCPU_EXCEEDS_MAX_TEMPLATE.format(
+                                vcpu_int=vcpu_int, max_vcpus=self.max_vcpus
+                            )
+                        )
+
+                    # Validate cpuset syntax (basic check)
+                    if not _CPUSET_RE.match(cpuset):
+                        raise ValueError(
+                            ErrorMessages.INVALID_CPUSET_SYNTAX_TEMPLATE.format(cpuset=cpuset)
+                        )
+
+                    vcpupin_list.append({"vcpu": vcpu, "cpuset": cpuset})
                 self.dismiss(vcpupin_list)
             except ValueError as e:
                 self.app.show_error_message(ErrorMessages.VALIDATION_ERROR_TEMPLATE.format(error=e))
-            except Exception as e:
-                self.app.show_error_message(ErrorMessages.INVALID_FORMAT_TEMPLATE.format(error=e))
         elif event.button.id == "cancel-btn":
             self.dismiss(None)
         elif event.button.id == "help-btn":
@@ -180,16 +198,11 @@ class EditNumaTuneModal(BaseModal[dict | None]):
         self.current_nodeset = current_nodeset
 
     def compose(self) -> ComposeResult:
-        modes = [
-            ("strict", "strict"),
-            ("preferred", "preferred"),
-            ("interleave", "interleave"),
-            ("None", "None"),
-        ]
-
         with Vertical(id="edit-numatune-dialog", classes="edit-cpu-dialog"):
             yield Label(StaticText.NUMA_MEMORY_MODE)
-            yield Select(modes, value=self.current_mode, id="numa-mode-select", allow_blank=False)
+            yield Select(
+                _NUMA_MODES, value=self.current_mode, id="numa-mode-select", allow_blank=False
+            )
             yield Label(StaticText.NODESET)
             yield Input(
                 placeholder=StaticText.NODESET_EXAMPLE,
@@ -212,7 +225,7 @@ class EditNumaTuneModal(BaseModal[dict | None]):
 
             # Validate nodeset syntax
             if nodeset:
-                if not all(c.isdigit() or c in ",-" for c in nodeset):
+                if not _CPUSET_RE.match(nodeset):
                     self.app.show_error_message(
                         ErrorMessages.INVALID_NODESET_SYNTAX_TEMPLATE.format(nodeset=nodeset)
                     )
@@ -17,8 +17,11 @@ class CustomMigrationModal(ModalScreen[dict | None]):
         super().__init__(**kwargs)
         self.actions = actions
         self.selections = {}
+        self._pool_selects: dict[int, Select] = {}
+        self._undefine_cb: Checkbox | None = None
 
     def compose(self) -> ComposeResult:
+        self._pool_selects = {}
         with Vertical(id="custom-migration-dialog"):
             yield Static(StaticText.CUSTOM_MIGRATION_PLAN)
 
@@ -30,18 +33,23 @@ class CustomMigrationModal(ModalScreen[dict | None]):
                     yield Static(StaticText.SOURCE_POOL.format(source_pool=action["source_pool"]))
                     dest_pools = action.get("dest_pools", [])
                     if dest_pools:
-                        yield Select(
+                        pool_select = Select(
                             [(pool, pool) for pool in dest_pools],
                             prompt="Select Destination Pool",
                             id=f"pool-select-{i}",
                         )
+                        self._pool_selects[i] = pool_select
+                        yield pool_select
                     else:
                         yield Static(StaticText.NO_DESTINATION_POOLS)
                 elif action["type"] == "manual_copy":
                     yield Static(StaticText.DISK_PATH.format(disk_path=action["disk_path"]))
                     yield Static(StaticText.ACTION_MESSAGE.format(message=action["message"]))
 
-            yield Checkbox(StaticText.UNDEFINE_SOURCE_VM, value=True, id="undefine-checkbox")
+            self._undefine_cb = Checkbox(
+                StaticText.UNDEFINE_SOURCE_VM, value=True, id="undefine-checkbox"
+            )
+            yield self._undefine_cb
 
             with Vertical(classes="modal-buttons"):
                 yield Button(ButtonLabels.CONFIRM, variant="primary", id="confirm")
@@ -50,12 +58,10 @@ class CustomMigrationModal(ModalScreen[dict | None]):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
         if event.button.id == "confirm":
-            for i, action in enumerate(self.actions):
-                if action["type"] == "move_volume":
-                    select = self.query_one(f"#pool-select-{i}", Select)
-                    self.selections[i] = select.value
+            for i, pool_select in self._pool_selects.items():
+                self.selections[i] = pool_select.value
 
-            self.selections["undefine_source"] = self.query_one("#undefine-checkbox").value
+            self.selections["undefine_source"] = self._undefine_cb.value
             self.dismiss(self.selections)
         else:
             self.dismiss(None)
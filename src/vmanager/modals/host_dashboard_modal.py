@@ -8,9 +8,9 @@ from textual.app import ComposeResult
 from textual.containers import Grid, Horizontal, Vertical
 from textual.widgets import Button, Label, ProgressBar, Rule, TabbedContent, TabPane
 
-from ..constants import ButtonLabels, StaticText, TabTitles
+from ..constants import StaticText, TabTitles
 from ..libvirt_utils import get_host_resources, get_total_vm_allocation
-from .base_modals import BaseModal
+from .base_modals import BaseModal, close_button
 
 
 class HostDashboardModal(BaseModal[None]):
@@ -109,7 +109,7 @@ class HostDashboardModal(BaseModal[None]):
                         )
 
             with Horizontal(classes="dialog-buttons"):
-                yield Button(ButtonLabels.CLOSE, id="close-btn", variant="primary")
+                yield close_button()
 
     def on_mount(self) -> None:
         # Update progress bars
@@ -2,18 +2,97 @@
 Host Stats modals
 """
 
+import json
 import logging
+import os
+import re
 import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 
+from rich.markup import escape
 from textual.app import ComposeResult
 from textual.events import Click, Message
 from textual.reactive import reactive
 from textual.widgets import Label, Static
 from textual.worker import get_current_worker
 
+from ..constants import AppInfo
 from ..libvirt_utils import get_active_vm_allocation, get_host_resources
 from ..utils import extract_server_name_from_uri
 
+_INVALID_ID_CHARS_RE = re.compile(r"[^\w-]")
+
+HOST_RESOURCES_CACHE_FILE = Path.home() / ".cache" / AppInfo.name / "host_resources_cache.json"
+HOST_RESOURCES_CACHE_VERSION = 2
+HOST_RESOURCES_CACHE_TTL = 7 * 24 * 3600  # seconds
+# Only what does not change while a host is up is persisted
+HOST_RESOURCES_STATIC_KEYS = ("total_cpus", "available_memory")
+
+_host_resources_cache: dict | None = None
+_host_resources_lock = threading.Lock()
+
+
+def _load_host_resources_cache() -> dict:
+    """Return the on-disk host resources cache, reading it once per process.
+
+    Must be called with _host_resources_lock held.
+    """
+    global _host_resources_cache
+    if _host_resources_cache is None:
+        try:
+            data = json.loads(HOST_RESOURCES_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            data = None
+        hosts = {}
+        if (
+            isinstance(data, dict)
+            and data.get("version") == HOST_RESOURCES_CACHE_VERSION
+            and isinstance(data.get("hosts"), dict)
+        ):
+            # Malformed entries are dropped, they count as cache misses
+            hosts = {
+                uri: entry
+                for uri, entry in data["hosts"].items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("timestamp"), (int, float))
+                and isinstance(entry.get("resources"), dict)
+            }
+        _host_resources_cache = hosts
+    return _host_resources_cache
+
+
+def get_cached_host_resources(uri: str) -> dict | None:
+    """Return persisted host resources for a URI if present and not expired."""
+    with _host_resources_lock:
+        entry = _load_host_resources_cache().get(uri)
+    if not entry or time.time() - entry["timestamp"] > HOST_RESOURCES_CACHE_TTL:
+        return None
+    resources = entry["resources"]
+    if not all(key in resources for key in HOST_RESOURCES_STATIC_KEYS):
+        return None
+    return resources
+
+
+def store_host_resources(uri: str, resources: dict) -> None:
+    """Persist the static host resources of a URI to the on-disk cache."""
+    static = {key: resources[key] for key in HOST_RESOURCES_STATIC_KEYS if key in resources}
+    if len(static) != len(HOST_RESOURCES_STATIC_KEYS):
+        return
+    with _host_resources_lock:
+        hosts = _load_host_resources_cache()
+        hosts[uri] = {"timestamp": time.time(), "resources": static}
+        data = {"version": HOST_RESOURCES_CACHE_VERSION, "hosts": hosts}
+        tmp_path = HOST_RESOURCES_CACHE_FILE.with_suffix(".tmp")
+        try:
+            HOST_RESOURCES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, HOST_RESOURCES_CACHE_FILE)
+        except (OSError, TypeError) as e:
+            logging.warning("Could not write host resources cache: %s", e)
+
 
 class SingleHostStat(Static):
     """
@@ -49,17 +128,19 @@ class SingleHostStat(Static):
         self.server_name = name
         self.vm_service = vm_service
         self.server_color = server_color
+        safe_name = _INVALID_ID_CHARS_RE.sub("_", name)
         self.server_label = Label(
-            "", id=f"single_host_stat_label_{self.server_name.replace(' ', '_').replace('.', '_')}"
+            f"[bold {server_color}]{escape(name)}[/] ", id=f"single_host_stat_label_{safe_name}"
         )
         self.cpu_label = Label("", classes="stat-label")
         self.mem_label = Label("", classes="stat-label")
         self.host_res = None
+        # Connection host_res was last read from, to refresh it on reconnect
+        self._host_res_conn = None
+        self._in_flight = False
+        self._in_flight_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
-        self.server_label.styles.color = self.server_color
-        self.server_label.styles.text_style = "bold"
-        self.server_label.update(f"{self.server_name} ")
         yield self.server_label
         yield self.cpu_label
         yield Label(" ")
@@ -72,8 +153,24 @@ class SingleHostStat(Static):
 
     def update_stats(self):
         """Fetches and updates stats for this host."""
+        with self._in_flight_lock:
+            if self._in_flight:
+                return
+            self._in_flight = True
 
         def _fetch_and_update():
+            on_main = threading.current_thread() is threading.main_thread()
+
+            def _ui(fn, *args):
+                if on_main:
+                    fn(*args)
+                else:
+                    self.app.call_from_thread(fn, *args)
+
+            def _set_status(text):
+                self.cpu_label.update(text)
+                self.mem_label.update(text)
+
             try:
                 # Check cancellation before potentially expensive op
                 try:
@@ -84,16 +181,16 @@ class SingleHostStat(Static):
 
                 conn = self.vm_service.connect(self.uri)
                 if not conn:
-                    if threading.current_thread() is threading.main_thread():
-                        self.cpu_label.update("Offline")
-                        self.mem_label.update("Offline")
-                    else:
-                        self.app.call_from_thread(self.cpu_label.update, "Offline")
-                        self.app.call_from_thread(self.mem_label.update, "Offline")
+                    _ui(_set_status, "Offline")
                     return
 
-                if self.host_res is None:
+                reconnected = self._host_res_conn is not None and conn is not self._host_res_conn
+                if self.host_res is None and not reconnected:
+                    self.host_res = get_cached_host_resources(self.uri)
+                if self.host_res is None or reconnected:
                     self.host_res = get_host_resources(conn)
+                    store_host_resources(self.uri, self.host_res)
+                self._host_res_conn = conn
 
                 current_alloc = get_active_vm_allocation(conn)
 
@@ -136,19 +233,14 @@ class SingleHostStat(Static):
                     self.mem_label.update(f"{fmt_mem(used_mem)}/{fmt_mem(total_mem)}")
                     self.mem_label.styles.background = get_status_bck(mem_pct)
 
-                if threading.current_thread() is threading.main_thread():
-                    _update_ui()
-                else:
-                    self.app.call_from_thread(_update_ui)
+                _ui(_update_ui)
 
             except Exception as e:
                 logging.error(f"Error updating host stats for {self.name}: {e}")
-                if threading.current_thread() is threading.main_thread():
-                    self.cpu_label.update("Err")
-                    self.mem_label.update("Err")
-                else:
-                    self.app.call_from_thread(self.cpu_label.update, "Err")
-                    self.app.call_from_thread(self.mem_label.update, "Err")
+                _ui(_set_status, "Err")
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight = False
 
         _fetch_and_update()
 
@@ -169,11 +261,21 @@ class HostStats(Static):
     }
     """
 
+    MAX_PARKED_HOSTS = 8
+
     def __init__(self, vm_service, get_server_color_callback):
         super().__init__()
         self.vm_service = vm_service
         self.get_server_color = get_server_color_callback
         self.active_hosts = {}
+        # Hidden widgets of recently disconnected hosts, kept to avoid remounting
+        self._parked: OrderedDict[str, SingleHostStat] = OrderedDict()
+        self._last_refresh = 0.0
+        self._min_interval = 1.0
+        self._refresh_lock = threading.Lock()
+        self._trailing_pending = False
+        self._name_cache: dict[str, str] = {}
+        self._servers_ref = None
 
     def update_hosts(self, active_uris, servers):
         """
@@ -181,30 +283,80 @@ class HostStats(Static):
         """
         current_uris = set(active_uris)
         existing_uris = set(self.active_hosts.keys())
+        if current_uris == existing_uris:
+            return
+
+        if servers is not self._servers_ref:
+            self._servers_ref = servers
+            self._name_cache = {
+                s["uri"]: s.get("name") or extract_server_name_from_uri(s["uri"])
+                for s in servers or ()
+            }
 
-        # Remove stale
+        # Park stale hosts, only removing the oldest ones beyond the cap
         for uri in existing_uris - current_uris:
             widget = self.active_hosts.pop(uri)
-            widget.remove()
+            widget.display = False
+            self._parked[uri] = widget
+            if len(self._parked) > self.MAX_PARKED_HOSTS:
+                _, oldest = self._parked.popitem(last=False)
+                oldest.remove()
 
         # Add new hosts
         for uri in current_uris - existing_uris:
-            name = self._get_server_name(uri, servers)
+            widget = self._parked.pop(uri, None)
+            if widget is not None:
+                widget.display = True
+                self.active_hosts[uri] = widget
+                self.app.set_timer(0.5, widget.update_stats)
+                continue
+            name = self._get_server_name(uri)
             color = self.get_server_color(uri)
             widget = SingleHostStat(uri, name, self.vm_service, color)
             self.active_hosts[uri] = widget
             self.mount(widget)
             self.app.set_timer(0.5, widget.update_stats)
 
-    def _get_server_name(self, uri: str, servers) -> str:
+    def _get_server_name(self, uri: str) -> str:
         """Helper to get server name from URI."""
-        if servers:
-            for s in servers:
-                if s["uri"] == uri:
-                    return s.get("name", extract_server_name_from_uri(uri))
-        return extract_server_name_from_uri(uri)
+        name = self._name_cache.get(uri)
+        if name is None:
+            name = extract_server_name_from_uri(uri)
+            self._name_cache[uri] = name
+        return name
 
     def refresh_stats(self):
-        """Triggers update on all children."""
+        """Triggers update on all children.
+
+        Calls made within the minimum interval are coalesced into a single
+        trailing refresh scheduled for the end of that interval.
+        """
+        with self._refresh_lock:
+            remaining = self._min_interval - (time.monotonic() - self._last_refresh)
+            schedule = remaining > 0 and not self._trailing_pending
+            if remaining > 0:
+                self._trailing_pending = True
+            else:
+                self._last_refresh = time.monotonic()
+        if remaining > 0:
+            # Scheduled outside the lock: call_from_thread blocks on the main thread
+            if schedule:
+                self._schedule_trailing_refresh(remaining)
+            return
         for widget in self.active_hosts.values():
             widget.update_stats()
+
+    def _schedule_trailing_refresh(self, delay: float) -> None:
+        """Sets a timer for the trailing refresh from whichever thread is calling."""
+        if threading.current_thread() is threading.main_thread():
+            self.set_timer(delay, self._run_trailing_refresh)
+        else:
+            self.app.call_from_thread(self.set_timer, delay, self._run_trailing_refresh)
+
+    def _run_trailing_refresh(self) -> None:
+        """Runs the coalesced refresh off the main thread."""
+        with self._refresh_lock:
+            self._trailing_pending = False
+        self.run_worker(
+            self.refresh_stats, name="host_stats_trailing_refresh", thread=True, exclusive=True
+        )
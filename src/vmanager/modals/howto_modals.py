@@ -0,0 +1,89 @@
+"""
+Modals to show the howto documents shipped in appdocs.
+"""
+
+from functools import lru_cache
+from importlib.resources import files
+
+from rich.markdown import Markdown as RichMarkdown
+from textual.app import ComposeResult
+from textual.containers import Horizontal, ScrollableContainer, Vertical
+from textual.widgets import Static
+
+from .base_modals import CloseOnButtonModal, close_button
+
+
+@lru_cache(maxsize=None)
+def load_howto_doc(filename: str) -> str:
+    """Read a markdown document from appdocs once per process."""
+    try:
+        return (files("vmanager") / "appdocs" / filename).read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        return "# Error: Documentation file not found."
+
+
+@lru_cache(maxsize=None)
+def render_howto_doc(filename: str) -> RichMarkdown:
+    """
+    Parse a howto document into a Rich renderable once per process.
+
+    A Static showing a prebuilt renderable mounts far faster than Textual's
+    Markdown widget, which builds one child widget per block on every open.
+    """
+    return RichMarkdown(load_howto_doc(filename))
+
+
+class HowToModal(CloseOnButtonModal[None]):
+    """
+    A modal displaying one of the appdocs markdown documents.
+
+    Subclasses set DOC_FILE and DIALOG_ID; the widget ids are derived from
+    DIALOG_ID so each subclass keeps its own CSS selectors.
+    """
+
+    DOC_FILE = ""
+    DIALOG_ID = ""
+    DIALOG_CLASSES = ""
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id=f"{self.DIALOG_ID}-dialog", classes=self.DIALOG_CLASSES):
+            with ScrollableContainer(id=f"{self.DIALOG_ID}-content"):
+                yield Static(render_howto_doc(self.DOC_FILE), id=f"{self.DIALOG_ID}-markdown")
+        with Horizontal(id="dialog-buttons"):
+            yield close_button()
+
+
+class HowToDiskModal(HowToModal):
+    """A modal to display instructions for managing VM disks."""
+
+    DOC_FILE = "howto_disk.md"
+    DIALOG_ID = "howto-disk"
+
+
+class HowToNetworkModal(HowToModal):
+    """A modal to display instructions for network configuration."""
+
+    DOC_FILE = "howto_network.md"
+    DIALOG_ID = "howto-network"
+
+
+class HowToOverlayModal(HowToModal):
+    """A modal to display instructions for disk overlays."""
+
+    DOC_FILE = "howto_overlay.md"
+    DIALOG_ID = "howto-overlay"
+    DIALOG_CLASSES = "howto-dialog"
+
+
+class HowToSSHModal(HowToModal):
+    """A modal to display instructions for using an ssh-agent."""
+
+    DOC_FILE = "howto_ssh.md"
+    DIALOG_ID = "howto-ssh"
+
+
+class HowToVirtIOFSModal(HowToModal):
+    """A modal to display instructions for using VirtIO-FS."""
+
+    DOC_FILE = "howto_virtiofs.md"
+    DIALOG_ID = "howto-virtiofs"
@@ -2,7 +2,7 @@
 Modals for input device configuration and all Input dialog
 """
 
-import re
+import string
 
 from textual import on
 from textual.app import ComposeResult
@@ -13,9 +13,30 @@ from ..constants import ButtonLabels, ErrorMessages, StaticText, VMDetailConstan
 from .base_modals import BaseModal
 
 
+def _ascii_delete_table(keep: str) -> dict:
+    """Build a str.translate table deleting every ASCII character not in keep."""
+    return str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in keep))
+
+
+_SANITIZE_INPUT_TABLE = _ascii_delete_table(string.ascii_letters + string.digits + "._-")
+_SANITIZE_DOMAIN_TABLE = _ascii_delete_table(string.ascii_letters + string.digits + ".-")
+
+
+# Select options for the stock input device types and buses
+_INPUT_TYPE_OPTIONS = tuple((t, t) for t in VMDetailConstants.INPUT_DEVICE_TYPES)
+_INPUT_BUS_OPTIONS = tuple((b, b) for b in VMDetailConstants.INPUT_DEVICE_BUSES)
+
+
+def _ascii_translate(text: str, table: dict) -> str:
+    """Drop non-ASCII characters, then apply an ASCII translate table."""
+    return text.encode("ascii", "ignore").decode("ascii").translate(table)
+
+
 class InputModal(BaseModal[str | None]):
     """A generic modal for getting text input from the user."""
 
+    __slots__ = ("prompt", "initial_value", "restrict")
+
     def __init__(self, prompt: str, initial_value: str = "", restrict: str | None = None):
         super().__init__()
         self.prompt = prompt
@@ -37,24 +58,45 @@ class InputModal(BaseModal[str | None]):
             self.dismiss(None)
 
 
-class AddInputDeviceModal(BaseModal[None]):
+class AddInputDeviceModal(BaseModal[dict | None]):
     """A modal for adding a new input device."""
 
+    __slots__ = (
+        "available_types",
+        "available_buses",
+        "_type_options",
+        "_bus_options",
+        "_type_select",
+        "_bus_select",
+        "_add_button",
+    )
+
     def __init__(self, available_types: list, available_buses: list):
         super().__init__()
         self.available_types = available_types
         self.available_buses = available_buses
+        if available_types is VMDetailConstants.INPUT_DEVICE_TYPES:
+            self._type_options = _INPUT_TYPE_OPTIONS
+        else:
+            self._type_options = tuple((t, t) for t in available_types)
+        if available_buses is VMDetailConstants.INPUT_DEVICE_BUSES:
+            self._bus_options = _INPUT_BUS_OPTIONS
+        else:
+            self._bus_options = tuple((b, b) for b in available_buses)
+        self._type_select: Select | None = None
+        self._bus_select: Select | None = None
+        self._add_button: Button | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="add-input-container"):
             yield Label(StaticText.INPUT_DEVICE)
             yield Select(
-                [(t, t) for t in self.available_types],
+                self._type_options,
                 prompt=StaticText.INPUT_TYPE_PROMPT,
                 id="input-type-select",
             )
             yield Select(
-                [(b, b) for b in self.available_buses],
+                self._bus_options,
                 prompt=StaticText.INPUT_BUS_PROMPT,
                 id="input-bus-select",
             )
@@ -63,26 +105,28 @@ class AddInputDeviceModal(BaseModal[None]):
                     yield Button(ButtonLabels.ADD, variant="primary", id="add-input", disabled=True)
                     yield Button(ButtonLabels.CANCEL, variant="default", id="cancel-input")
 
+    def on_mount(self) -> None:
+        self._type_select = self.query_one("#input-type-select", Select)
+        self._bus_select = self.query_one("#input-bus-select", Select)
+        self._add_button = self.query_one("#add-input", Button)
+
     @on(Select.Changed)
     def on_select_changed(self) -> None:
-        type_select = self.query_one("#input-type-select", Select)
-        bus_select = self.query_one("#input-bus-select", Select)
-
-        is_type_selected = type_select.value != Select.NULL
-        is_bus_selected = bus_select.value != Select.NULL
+        is_type_selected = self._type_select.value != Select.NULL
+        is_bus_selected = self._bus_select.value != Select.NULL
 
-        self.query_one("#add-input", Button).disabled = not (is_type_selected and is_bus_selected)
+        self._add_button.disabled = not (is_type_selected and is_bus_selected)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "add-input":
-            input_type = self.query_one("#input-type-select", Select).value
-            input_bus = self.query_one("#input-bus-select", Select).value
+            input_type = self._type_select.value
+            input_bus = self._bus_select.value
             if input_type and input_bus:
                 self.dismiss({"type": input_type, "bus": input_bus})
             else:
-                self.dismiss()
+                self.dismiss(None)
         else:
-            self.dismiss()
+            self.dismiss(None)
 
 
 class AddWatchdogModal(BaseModal[dict | None]):
@@ -228,12 +272,13 @@ def _sanitize_input(input_string: str) -> tuple[str, bool]:
     if not original_stripped:
         return "", True  # Empty input is considered modified
 
-    sanitized = re.sub(r"[^a-zA-Z0-9._-]", "", original_stripped)
+    sanitized = _ascii_translate(original_stripped, _SANITIZE_INPUT_TABLE)
 
     if len(sanitized) > 64:
         raise ValueError(ErrorMessages.SANITIZED_INPUT_TOO_LONG)
 
-    if sanitized != original_stripped:
+    # Sanitizing only ever removes characters
+    if len(sanitized) != len(original_stripped):
         was_modified = True
 
     return sanitized, was_modified
@@ -252,12 +297,12 @@ def _sanitize_domain_name(input_string: str) -> tuple[str, bool]:
         return "", True  # Empty input is considered modified
 
     # Allow alphanumeric, hyphens, and periods
-    sanitized = re.sub(r"[^a-zA-Z0-9.-]", "", original_stripped)
+    sanitized = _ascii_translate(original_stripped, _SANITIZE_DOMAIN_TABLE)
 
     if len(sanitized) > 64:  # Common domain name length limit
         raise ValueError(ErrorMessages.SANITIZED_DOMAIN_TOO_LONG)
 
-    if sanitized != original_stripped:
+    if len(sanitized) != len(original_stripped):
         was_modified = True
 
     return sanitized, was_modified
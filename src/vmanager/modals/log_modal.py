@@ -2,27 +2,79 @@
 Log function
 """
 
+import codecs
+import os
+
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Label, TextArea
+from textual.worker import get_current_worker
+
+from ..constants import ButtonLabels, ErrorMessages
+from .base_modals import CloseOnButtonModal
+
+# Amount of log read at once from the end of the file, and on each scroll-up
+LOG_TAIL_BYTES = 256 * 1024
+# Size of the pieces the tail is streamed into the TextArea with
+LOG_STREAM_CHUNK = 64 * 1024
+
 
-from ..constants import ButtonLabels
-from .base_modals import BaseModal
+def _read_log_chunk(log_path: str, end: int, max_bytes: int = LOG_TAIL_BYTES) -> tuple[str, int]:
+    """
+    Read up to max_bytes of a log file ending at offset end.
 
+    Args:
+        log_path: Path of the log file
+        end: Offset to stop reading at, or -1 for the end of the file
+        max_bytes: Maximum number of bytes to read
 
-class LogModal(BaseModal[None]):
+    Returns:
+        tuple: (text, start offset). Unless the chunk starts at the beginning
+        of the file, the partial first line is dropped and the start offset
+        points just after it.
+    """
+    st = os.stat(log_path)
+    if end < 0:
+        end = st.st_size
+    start = max(0, end - max_bytes)
+    with open(log_path, "rb", buffering=max(st.st_blksize, 128 * 1024)) as f:
+        f.seek(start)
+        data = f.read(end - start)
+    if start > 0:
+        newline = data.find(b"\n")
+        if newline != -1:
+            start += newline + 1
+            data = data[newline + 1 :]
+    return data.decode("utf-8", errors="replace"), start
+
+
+class LogModal(CloseOnButtonModal[None]):
     """Modal Screen to show Log"""
 
-    def __init__(self, log_content: str, title: str = "Log View") -> None:
+    # title is not listed: it is Screen's reactive and must stay one
+    __slots__ = ("log_content", "log_path", "_loaded_from", "_loading_earlier")
+
+    def __init__(
+        self, log_content: str = "", title: str = "Log View", log_path: str | None = None
+    ) -> None:
         super().__init__()
         self.log_content = log_content
         self.title = title
+        self.log_path = log_path
+        # Offset in log_path of the first byte loaded into the TextArea
+        self._loaded_from = 0
+        self._loading_earlier = False
 
     def compose(self) -> ComposeResult:
         with Vertical(id="text-show"):
             yield Label(self.title, id="title")
-            text_area = TextArea()
-            text_area.load_text(self.log_content)
+            if self.log_path is None:
+                # Start with the cursor at the end so no extra scroll is needed
+                text_area = TextArea(self.log_content)
+                text_area.cursor_location = text_area.document.end
+            else:
+                text_area = TextArea()
             yield text_area
         with Horizontal():
             yield Button(
@@ -31,9 +83,83 @@ class LogModal(BaseModal[None]):
 
     def on_mount(self) -> None:
         """Called when the modal is mounted."""
+        if self.log_path is not None:
+            self.query_one(TextArea).loading = True
+            self.stream_log_tail()
+
+    @work(thread=True)
+    def stream_log_tail(self) -> None:
+        """Read the end of the log file and stream it into the TextArea."""
+        worker = get_current_worker()
+        try:
+            end = os.stat(self.log_path).st_size
+            start = max(0, end - LOG_TAIL_BYTES)
+            with open(self.log_path, "rb") as f:
+                f.seek(start)
+                if start > 0:
+                    # Drop the partial first line, unless it is all there is
+                    skipped = f.readline(end - start)
+                    if skipped.endswith(b"\n"):
+                        start += len(skipped)
+                    else:
+                        f.seek(start)
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                remaining = end - start
+                while remaining > 0 and not worker.is_cancelled:
+                    data = f.read(min(LOG_STREAM_CHUNK, remaining))
+                    if not data:
+                        break
+                    remaining -= len(data)
+                    text = decoder.decode(data, final=remaining <= 0)
+                    if text:
+                        self.app.call_from_thread(self._append_log, text)
+        except FileNotFoundError:
+            self.app.call_from_thread(
+                self._append_log, ErrorMessages.LOG_FILE_NOT_FOUND.format(log_path=self.log_path)
+            )
+            start = 0
+        except OSError as e:
+            self.app.call_from_thread(
+                self._append_log, ErrorMessages.ERROR_READING_LOG_FILE.format(error=e)
+            )
+            start = 0
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._finish_log_tail, start)
+
+    def _append_log(self, text: str) -> None:
+        """Append a streamed piece of the log to the TextArea."""
+        text_area = self.query_one(TextArea)
+        text_area.loading = False
+        text_area.insert(text, text_area.document.end)
+
+    def _finish_log_tail(self, start: int) -> None:
+        """Move to the end and enable loading earlier parts of the log."""
         text_area = self.query_one(TextArea)
-        text_area.scroll_end()
+        text_area.loading = False
+        self._loaded_from = start
+        text_area.cursor_location = text_area.document.end
+        self.watch(text_area, "scroll_y", self._on_log_scrolled, init=False)
+
+    def _on_log_scrolled(self, scroll_y: float) -> None:
+        """Load the previous part of the log when scrolled to the top."""
+        if scroll_y == 0 and self._loaded_from > 0 and not self._loading_earlier:
+            self._loading_earlier = True
+            self.load_earlier_log(self._loaded_from)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "cancel-btn":
-            self.dismiss(None)
+    @work(exclusive=True, thread=True)
+    def load_earlier_log(self, end: int) -> None:
+        """Read the log chunk preceding end and prepend it to the TextArea."""
+        try:
+            text, start = _read_log_chunk(self.log_path, end)
+        except OSError:
+            text, start = "", 0
+        self.app.call_from_thread(self._prepend_log, text, start)
+
+    def _prepend_log(self, text: str, start: int) -> None:
+        """Insert an earlier log chunk, keeping the current lines in view."""
+        text_area = self.query_one(TextArea)
+        if text:
+            text_area.insert(text, (0, 0))
+            text_area.scroll_to(y=text.count("\n"), animate=False)
+        self._loaded_from = start
+        self._loading_earlier = False
@@ -2,25 +2,219 @@
 Modals for handling VM migration.
 """
 
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from logging.handlers import RotatingFileHandler
 from typing import Dict, List
 
 import libvirt
+from rich.errors import MarkupError
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Grid, Horizontal, ScrollableContainer, Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button, Checkbox, Label, ProgressBar, Select, Static
+from textual.widget import Widget
+from textual.widgets import Button, Checkbox, Label, ProgressBar, RichLog, Select, Static
 
+from ..config import get_log_path
 from ..constants import ButtonLabels, ErrorMessages, StaticText
+from ..libvirt_utils import get_cached_hostname
 from ..storage_manager import find_shared_storage_pools
-from ..utils import extract_server_name_from_uri
+from ..utils import SanitizingFilter, extract_server_name_from_uri
 from ..vm_actions import check_server_migration_compatibility, check_vm_migration_compatibility
 from ..vm_migration import custom_migrate_vm, execute_custom_migration
 from .custom_migration_modal import CustomMigrationModal
 
 # from pprint import pprint # pprint(vars(object))
 
+# Lines kept in the results log; older ones are dropped during long migrations
+MAX_LOG_LINES = 5000
+
+# The full migration output is also kept in migration.log, next to the main log
+MIGRATION_LOG_MAX_BYTES = 10 * 1024 * 1024
+MIGRATION_LOG_BACKUP_COUNT = 3
+
+# Widgets looked up once on mount, by id
+_WIDGET_IDS = (
+    "check",
+    "start",
+    "close",
+    "dest-server-select",
+    "copy-storage-all",
+    "unsafe",
+    "persistent",
+    "compress",
+    "tunnelled",
+    "custom",
+    "undefine-source",
+    "results-log",
+    "migration-progress",
+    "migration-summary-grid",
+    "can-migrate-list",
+    "cannot-migrate-list",
+)
+
+# Server-wide informational messages only worth showing for the first VM
+_REDUNDANT_SERVER_INFOS = ("manually verify", "Firewalls", "user and")
+
+# Log line template of a compatibility issue, by severity
+_SERVER_TPL = {
+    "ERROR": StaticText.SERVER_ERROR_TEMPLATE,
+    "WARNING": StaticText.SERVER_WARNING_TEMPLATE,
+    "INFO": StaticText.SERVER_INFO_TEMPLATE,
+}
+_VM_TPL = {
+    "ERROR": StaticText.VM_ERROR_TEMPLATE,
+    "WARNING": StaticText.VM_WARNING_TEMPLATE,
+    "INFO": StaticText.VM_INFO_TEMPLATE,
+}
+_SEVERITIES = ("ERROR", "WARNING", "INFO")
+
+
+@lru_cache(maxsize=1)
+def _get_migration_logger() -> logging.Logger:
+    """Return the logger writing migration output to a rotating migration.log."""
+    logger = logging.getLogger("vmanager.migration")
+    # Kept out of the main application log
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    try:
+        handler = RotatingFileHandler(
+            get_log_path().parent / "migration.log",
+            maxBytes=MIGRATION_LOG_MAX_BYTES,
+            backupCount=MIGRATION_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logging.error("Cannot open the migration log file: %s", e)
+        logger.addHandler(logging.NullHandler())
+        return logger
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    handler.addFilter(SanitizingFilter())
+    logger.addHandler(handler)
+    return logger
+
+
+def _plain_text(line: str) -> str:
+    """Strip the Rich markup of a log line for the log file."""
+    try:
+        return Text.from_markup(line).plain
+    except MarkupError:
+        return line
+
+
+def _bucket_issues(issues: List[dict]) -> Dict[str, List[dict]]:
+    """Split compatibility issues by severity in a single pass."""
+    buckets = {"ERROR": [], "WARNING": [], "INFO": []}
+    for issue in issues:
+        bucket = buckets.get(issue["severity"])
+        if bucket is not None:
+            bucket.append(issue)
+    return buckets
+
+
+def _migration_flags(
+    is_live: bool,
+    copy_storage_all: bool,
+    unsafe: bool,
+    persistent: bool,
+    compress: bool,
+    tunnelled: bool,
+) -> int:
+    """Build the libvirt migration flags for the selected options."""
+    if not is_live:
+        flags = libvirt.VIR_MIGRATE_OFFLINE | libvirt.VIR_MIGRATE_PEER2PEER
+        if persistent:
+            flags |= libvirt.VIR_MIGRATE_PERSIST_DEST
+        # VIR_MIGRATE_TUNNELLED is not applied for offline migration as it does not make sense.
+        if copy_storage_all:
+            flags |= libvirt.VIR_MIGRATE_NON_SHARED_DISK
+        return flags
+
+    flags = libvirt.VIR_MIGRATE_LIVE | libvirt.VIR_MIGRATE_PEER2PEER
+    if copy_storage_all:
+        flags |= libvirt.VIR_MIGRATE_NON_SHARED_DISK
+    if unsafe:
+        flags |= libvirt.VIR_MIGRATE_UNSAFE
+    if persistent:
+        flags |= libvirt.VIR_MIGRATE_PERSIST_DEST
+    if compress:
+        flags |= libvirt.VIR_MIGRATE_COMPRESSED
+    if tunnelled:
+        flags |= libvirt.VIR_MIGRATE_TUNNELLED
+    return flags
+
+
+@dataclass(frozen=True, slots=True)
+class VMCheckResult:
+    """Outcome of the migration compatibility checks of one VM."""
+
+    vm_name: str
+    log_lines: tuple[str, ...]
+    passed: bool
+
+
+def _check_vm_compatibility(
+    source_conn: libvirt.virConnect,
+    dest_conn: libvirt.virConnect,
+    vm: libvirt.virDomain,
+    is_live: bool,
+    index: int,
+) -> VMCheckResult:
+    """
+    Run the migration compatibility checks of one VM.
+
+    Called from a thread pool: it only uses its arguments and locals, and
+    returns the log lines instead of writing them.
+    """
+    lines = []
+    write_log = lines.append
+    vm_name = vm.name()
+    try:
+        write_log(StaticText.CHECKING_VM_HEADER_TEMPLATE.format(vm_name=vm_name))
+
+        # --- Server Compatibility ---
+        write_log(StaticText.SERVER_COMPATIBILITY_HEADER)
+        server_issues = check_server_migration_compatibility(
+            source_conn, dest_conn, vm_name, is_live
+        )
+
+        server_buckets = _bucket_issues(server_issues)
+        # Filter out redundant server-wide informational messages for subsequent VMs
+        if index > 0:
+            server_buckets["INFO"] = [
+                issue
+                for issue in server_buckets["INFO"]
+                if not any(s in issue["message"] for s in _REDUNDANT_SERVER_INFOS)
+            ]
+        for severity in _SEVERITIES:
+            template = _SERVER_TPL[severity]
+            for issue in server_buckets[severity]:
+                write_log(template.format(message=issue["message"]))
+
+        # --- VM Compatibility ---
+        write_log(StaticText.VM_COMPATIBILITY_HEADER)
+        vm_issues = check_vm_migration_compatibility(vm, dest_conn, is_live)
+
+        vm_buckets = _bucket_issues(vm_issues)
+        for severity in _SEVERITIES:
+            template = _VM_TPL[severity]
+            for issue in vm_buckets[severity]:
+                write_log(template.format(message=issue["message"]))
+
+        if server_buckets["ERROR"] or vm_buckets["ERROR"]:
+            write_log(StaticText.COMPATIBILITY_CHECK_FAILED_TEMPLATE.format(vm_name=vm_name))
+            return VMCheckResult(vm_name, tuple(lines), False)
+        write_log(StaticText.COMPATIBILITY_CHECK_PASSED_TEMPLATE.format(vm_name=vm_name))
+        return VMCheckResult(vm_name, tuple(lines), True)
+    except Exception as e:
+        write_log(StaticText.FATAL_ERROR_CHECKING_TEMPLATE.format(vm_name=vm_name, error=e))
+        return VMCheckResult(vm_name, tuple(lines), False)
+
 
 class MigrationModal(ModalScreen):
     """A modal to handle VM migration."""
@@ -43,51 +237,19 @@ class MigrationModal(ModalScreen):
         self.dest_uri = None
         self.compatibility_checked = False
         self.checks_passed = False
-        self.log_content = ""
+        self._widgets: Dict[str, Widget] = {}
+        # Log lines and progress steps are queued by the workers and
+        # flushed to the UI by a timer
+        self._pending_log_lines: list[str] = []
+        self._pending_progress = 0
+        self._log_lock = threading.Lock()
         self.can_migrate_vms = []
         self.cannot_migrate_vms = []
 
     def compose(self) -> ComposeResult:
         vm_names = ", ".join([vm.name() for vm in self.vms_to_migrate])
-        source_uri = self.source_conn.getURI()
-
-        try:
-            source_hostname = self.source_conn.getHostname()
-        except libvirt.libvirtError:
-            source_hostname = None  # Can't get hostname, will have to rely on URI
-
-        dest_servers = []
-        for uri, conn in self.connections.items():
-            # Compare libvirt-reported URIs (not configured keys) to handle FQDN vs short name
-            # differences between what was configured and what libvirt actually resolves.
-            try:
-                if conn.getURI() == source_uri:
-                    continue
-            except libvirt.libvirtError:
-                if uri == source_uri:
-                    continue
-
-            if source_hostname:
-                try:
-                    dest_hostname = conn.getHostname()
-                    if dest_hostname == source_hostname:
-                        continue  # It's the same host, skip it
-                except libvirt.libvirtError:
-                    # Could not get hostname for destination, can't compare.
-                    # We will let it be in the list and let libvirt fail if it's the same.
-                    # This preserves existing behavior for problematic connections.
-                    pass
-
-            dest_servers.append((extract_server_name_from_uri(uri), uri))
-
         migration_type = "Live" if self.is_live else "Offline"
 
-        default_dest_uri = None
-        if dest_servers:
-            default_dest_uri = dest_servers[0][1]
-            self.dest_conn = self.connections[default_dest_uri]
-            self.dest_uri = default_dest_uri
-
         with Vertical(
             id="migration-dialog",
         ):
@@ -98,12 +260,12 @@ class MigrationModal(ModalScreen):
                     )
                 )
                 yield Static(StaticText.SELECT_DESTINATION_SERVER)
+                # Filled in by load_dest_servers once the hosts have been queried
                 yield Select(
-                    dest_servers,
+                    [],
                     id="dest-server-select",
                     prompt="Destination...",
-                    value=default_dest_uri,
-                    allow_blank=False,
+                    disabled=True,
                 )
 
                 yield Static(StaticText.MIGRATION_OPTIONS)
@@ -154,7 +316,7 @@ class MigrationModal(ModalScreen):
                     )
                 yield Static(StaticText.COMPATIBILITY_CHECK_RESULTS)
                 yield ProgressBar(total=100, show_eta=False, id="migration-progress")
-                yield Static(id="results-log")
+                yield RichLog(id="results-log", wrap=True, markup=True, max_lines=MAX_LOG_LINES)
                 yield Grid(
                     ScrollableContainer(
                         Static(StaticText.VMS_READY_FOR_MIGRATION, classes="summary-title"),
@@ -172,6 +334,7 @@ class MigrationModal(ModalScreen):
                     ButtonLabels.CHECK_COMPATIBILITY,
                     variant="primary",
                     id="check",
+                    disabled=True,
                     classes="Buttonpage",
                 )
                 yield Button(
@@ -190,17 +353,62 @@ class MigrationModal(ModalScreen):
                 )
 
     def _lock_controls(self, lock: bool):
-        self.query_one("#check").disabled = lock
-        self.query_one("#start").disabled = True
-        self.query_one("#dest-server-select").disabled = lock
-        self.query_one("#close").disabled = lock
+        self._widgets["check"].disabled = lock
+        self._widgets["start"].disabled = True
+        self._widgets["dest-server-select"].disabled = lock
+        self._widgets["close"].disabled = lock
 
     def on_mount(self) -> None:
         """Called when the modal is mounted."""
-        log = self.query_one("#results-log", Static)
-        log.wrap = True
-        self.query_one("#migration-progress").styles.display = "none"
-        self.query_one("#migration-summary-grid").styles.display = "none"
+        self._widgets = {widget_id: self.query_one(f"#{widget_id}") for widget_id in _WIDGET_IDS}
+        self._widgets["migration-progress"].styles.display = "none"
+        self._widgets["migration-summary-grid"].styles.display = "none"
+        self.set_interval(0.25, self._flush_log)
+        self.load_dest_servers()
+
+    @work(exclusive=True, thread=True, group="dest-servers")
+    def load_dest_servers(self):
+        """Find the possible destination servers without blocking the UI."""
+        source_uri = self.source_conn.getURI()
+        # None if libvirt can't report it, will have to rely on URI
+        source_hostname = get_cached_hostname(source_uri, self.source_conn)
+        host_by_uri = {}
+        if source_hostname:
+            host_by_uri = {
+                uri: get_cached_hostname(uri, conn) for uri, conn in self.connections.items()
+            }
+
+        dest_servers = []
+        for uri, conn in self.connections.items():
+            # Compare libvirt-reported URIs (not configured keys) to handle FQDN vs short name
+            # differences between what was configured and what libvirt actually resolves.
+            try:
+                if conn.getURI() == source_uri:
+                    continue
+            except libvirt.libvirtError:
+                if uri == source_uri:
+                    continue
+
+            # If the destination hostname is unknown we can't compare: leave it in
+            # the list and let libvirt fail if it's the same host.
+            if source_hostname and host_by_uri[uri] == source_hostname:
+                continue  # It's the same host, skip it
+
+            dest_servers.append((extract_server_name_from_uri(uri), uri))
+
+        self.app.call_from_thread(self._apply_dest_servers, dest_servers)
+
+    def _apply_dest_servers(self, dest_servers: list[tuple[str, str]]):
+        """Fill the destination select and default to its first server."""
+        select = self._widgets["dest-server-select"]
+        select.set_options(dest_servers)
+        select.disabled = False
+        self._widgets["check"].disabled = False
+        if dest_servers:
+            default_dest_uri = dest_servers[0][1]
+            self.dest_conn = self.connections[default_dest_uri]
+            self.dest_uri = default_dest_uri
+            select.value = default_dest_uri
 
     @on(Select.Changed, "#dest-server-select")
     def on_select_changed(self, event: Select.Changed):
@@ -212,32 +420,54 @@ class MigrationModal(ModalScreen):
             self.dest_conn = None
             self.dest_uri = None
 
-        self.query_one("#start", Button).disabled = True
+        self._widgets["start"].disabled = True
         self.compatibility_checked = False
         self.checks_passed = False
         self._clear_log()
 
     def _clear_log(self):
-        self.log_content = ""
-        self.query_one("#results-log", Static).update("")
-        self.can_migrate_vms = []
-        self.cannot_migrate_vms = []
-        self.query_one("#can-migrate-list").update("")
-        self.query_one("#cannot-migrate-list").update("")
-
-    def _write_log_line(self, line: str):
-        self.log_content += line + "\n"
-        self.query_one("#results-log", Static).update(self.log_content)
+        with self._log_lock:
+            self._pending_log_lines.clear()
+            self._pending_progress = 0
+        # Only touch the widgets that show something, to avoid needless repaints
+        if self._widgets["results-log"].lines:
+            self._widgets["results-log"].clear()
+        if self.can_migrate_vms:
+            self.can_migrate_vms = []
+            self._widgets["can-migrate-list"].update("")
+        if self.cannot_migrate_vms:
+            self.cannot_migrate_vms = []
+            self._widgets["cannot-migrate-list"].update("")
+
+    def _write_log(self, line: str) -> None:
+        """Queue a log line for the UI and add it to migration.log; safe from any thread."""
+        with self._log_lock:
+            self._pending_log_lines.append(line)
+        _get_migration_logger().info("%s", _plain_text(line))
+
+    def _advance_progress(self, steps: int = 1) -> None:
+        """Queue progress bar steps; safe to call from any thread."""
+        with self._log_lock:
+            self._pending_progress += steps
+
+    def _flush_log(self) -> None:
+        """Apply the queued log lines and progress steps with one update each."""
+        with self._log_lock:
+            lines = self._pending_log_lines
+            self._pending_log_lines = []
+            steps = self._pending_progress
+            self._pending_progress = 0
+        if steps:
+            self._widgets["migration-progress"].advance(steps)
+        if lines:
+            log = self._widgets["results-log"]
+            for line in lines:
+                log.write(line)
 
     @work(exclusive=True, thread=True)
     def run_compatibility_checks(self):
         self.app.call_from_thread(self._lock_controls, True)
-
-        def write_log(line):
-            if threading.current_thread() is threading.main_thread():
-                self._write_log_line(line)
-            else:
-                self.app.call_from_thread(self._write_log_line, line)
+        write_log = self._write_log
 
         all_checks_ok = True
         shared_pools = find_shared_storage_pools(self.source_conn, self.dest_conn)
@@ -260,104 +490,75 @@ class MigrationModal(ModalScreen):
                 if pool["warning"]:
                     write_log(StaticText.POOL_WARNING_TEMPLATE.format(warning=pool["warning"]))
 
-        for i, vm in enumerate(self.vms_to_migrate):
-            try:
-                write_log(StaticText.CHECKING_VM_HEADER_TEMPLATE.format(vm_name=vm.name()))
-
-                # --- Server Compatibility ---
-                write_log(StaticText.SERVER_COMPATIBILITY_HEADER)
-                server_issues = check_server_migration_compatibility(
-                    self.source_conn, self.dest_conn, vm.name(), self.is_live
-                )
-
-                server_errors = [issue for issue in server_issues if issue["severity"] == "ERROR"]
-                for issue in server_errors:
-                    write_log(StaticText.SERVER_ERROR_TEMPLATE.format(message=issue["message"]))
-
-                server_warnings = [
-                    issue for issue in server_issues if issue["severity"] == "WARNING"
-                ]
-                for issue in server_warnings:
-                    write_log(StaticText.SERVER_WARNING_TEMPLATE.format(message=issue["message"]))
-
-                server_infos = [issue for issue in server_issues if issue["severity"] == "INFO"]
-                # Filter out redundant server-wide informational messages for subsequent VMs
-                if i > 0:
-                    server_infos = [
-                        issue
-                        for issue in server_infos
-                        if "manually verify" not in issue["message"]
-                        and "Firewalls" not in issue["message"]
-                        and "user and" not in issue["message"]
-                    ]
-                for issue in server_infos:
-                    write_log(StaticText.SERVER_INFO_TEMPLATE.format(message=issue["message"]))
-
-                # --- VM Compatibility ---
-                write_log(StaticText.VM_COMPATIBILITY_HEADER)
-                vm_issues = check_vm_migration_compatibility(vm, self.dest_conn, self.is_live)
-
-                vm_errors = [issue for issue in vm_issues if issue["severity"] == "ERROR"]
-                for issue in vm_errors:
-                    write_log(StaticText.VM_ERROR_TEMPLATE.format(message=issue["message"]))
-
-                vm_warnings = [issue for issue in vm_issues if issue["severity"] == "WARNING"]
-                for issue in vm_warnings:
-                    write_log(StaticText.VM_WARNING_TEMPLATE.format(message=issue["message"]))
-
-                vm_infos = [issue for issue in vm_issues if issue["severity"] == "INFO"]
-                for issue in vm_infos:
-                    write_log(StaticText.VM_INFO_TEMPLATE.format(message=issue["message"]))
-
-                errors = server_errors + vm_errors
-                if errors:
-                    all_checks_ok = False
-                    self.cannot_migrate_vms.append(vm.name())
-                    write_log(
-                        StaticText.COMPATIBILITY_CHECK_FAILED_TEMPLATE.format(vm_name=vm.name())
-                    )
-                else:
-                    self.can_migrate_vms.append(vm.name())
-                    write_log(
-                        StaticText.COMPATIBILITY_CHECK_PASSED_TEMPLATE.format(vm_name=vm.name())
-                    )
-            except Exception as e:
-                write_log(
-                    StaticText.FATAL_ERROR_CHECKING_TEMPLATE.format(vm_name=vm.name(), error=e)
-                )
-                all_checks_ok = False
-                self.cannot_migrate_vms.append(vm.name())
-                continue  # Continue to the next VM
+        vms = self.vms_to_migrate
+        results: List[VMCheckResult | None] = [None] * len(vms)
+        next_index = 0
+        can_migrate_vms = []
+        cannot_migrate_vms = []
+        # The checks are blocking libvirt calls on both hosts: run them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(vms))) as executor:
+            futures = {
+                executor.submit(
+                    _check_vm_compatibility, self.source_conn, self.dest_conn, vm, self.is_live, i
+                ): i
+                for i, vm in enumerate(vms)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                # Report in selection order, as soon as the next VM's result is in
+                while next_index < len(vms) and results[next_index] is not None:
+                    result = results[next_index]
+                    for line in result.log_lines:
+                        write_log(line)
+                    if result.passed:
+                        can_migrate_vms.append(result.vm_name)
+                    else:
+                        all_checks_ok = False
+                        cannot_migrate_vms.append(result.vm_name)
+                    next_index += 1
 
-        self.checks_passed = all_checks_ok
-        self.compatibility_checked = True
+        # Build the summaries here rather than on the UI thread
+        can_migrate_text = "\n".join([f"- {name}" for name in can_migrate_vms])
+        cannot_migrate_text = "\n".join([f"- {name}" for name in cannot_migrate_vms])
 
         def update_ui_after_check():
+            # The modal's state is only updated on the UI thread
+            self.can_migrate_vms = can_migrate_vms
+            self.cannot_migrate_vms = cannot_migrate_vms
+            self.checks_passed = all_checks_ok
+            self.compatibility_checked = True
+            self._flush_log()
             self._lock_controls(False)
-            self.query_one("#start").disabled = not self.checks_passed
-            can_migrate_text = "\n".join(f"- {name}" for name in self.can_migrate_vms)
-            cannot_migrate_text = "\n".join(f"- {name}" for name in self.cannot_migrate_vms)
-            self.query_one("#can-migrate-list").update(can_migrate_text)
-            self.query_one("#cannot-migrate-list").update(cannot_migrate_text)
-            self.query_one("#migration-summary-grid").styles.display = "block"
+            self._widgets["start"].disabled = not self.checks_passed
+            self._widgets["can-migrate-list"].update(can_migrate_text)
+            self._widgets["cannot-migrate-list"].update(cannot_migrate_text)
+            self._widgets["migration-summary-grid"].styles.display = "block"
 
         self.app.call_from_thread(update_ui_after_check)
 
+    @staticmethod
+    def _confirm_custom(
+        confirmed: threading.Event, user_selections: dict, selections: dict | None
+    ) -> None:
+        """CustomMigrationModal callback: store the selections and wake the worker."""
+        if selections:
+            user_selections.update(selections)
+        confirmed.set()
+
+    def _init_migration_ui(self, total: int) -> None:
+        """Lock the controls and show a reset progress bar, in one UI round trip."""
+        self._lock_controls(True)
+        progress_bar = self._widgets["migration-progress"]
+        progress_bar.total = total
+        progress_bar.progress = 0
+        progress_bar.styles.display = "block"
+        # Hide the migration summary grid when migration starts
+        self._widgets["migration-summary-grid"].styles.display = "none"
+
     @work(exclusive=True, thread=True)
     def run_migration(self):
-        def write_log(line):
-            if threading.current_thread() is threading.main_thread():
-                self._write_log_line(line)
-            else:
-                self.app.call_from_thread(self._write_log_line, line)
-
-        self.app.call_from_thread(self._lock_controls, True)
-
-        progress_bar = self.query_one("#migration-progress", ProgressBar)
-
-        self.app.call_from_thread(lambda: setattr(progress_bar, "total", len(self.vms_to_migrate)))
-        self.app.call_from_thread(lambda: setattr(progress_bar, "progress", 0))
-        self.app.call_from_thread(lambda: setattr(progress_bar.styles, "display", "block"))
+        write_log = self._write_log
+        self.app.call_from_thread(self._init_migration_ui, len(self.vms_to_migrate))
 
         last_log_percentage = -1
 
@@ -371,17 +572,21 @@ class MigrationModal(ModalScreen):
             if p >= 100:
                 last_log_percentage = -1
 
-        # Hide the migration summary grid when migration starts
-        self.query_one("#migration-summary-grid").styles.display = "none"
+        copy_storage_all = self._widgets["copy-storage-all"].value
+        unsafe = self._widgets["unsafe"].value
+        persistent = self._widgets["persistent"].value
+        compress = self._widgets["compress"].value
+        tunnelled = self._widgets["tunnelled"].value
 
-        copy_storage_all = self.query_one("#copy-storage-all", Checkbox).value
-        unsafe = self.query_one("#unsafe", Checkbox).value
-        persistent = self.query_one("#persistent", Checkbox).value
-        compress = self.query_one("#compress", Checkbox).value
-        tunnelled = self.query_one("#tunnelled", Checkbox).value
+        custom_migration = self._widgets["custom"].value
+        undefine_source = self._widgets["undefine-source"].value
 
-        custom_migration = self.query_one("#custom", Checkbox).value
-        undefine_source = self.query_one("#undefine-source", Checkbox).value
+        # The options can't change during the migration: compute the flags once
+        flags = _migration_flags(
+            self.is_live, copy_storage_all, unsafe, persistent, compress, tunnelled
+        )
+
+        call_from_thread = self.app.call_from_thread
 
         for vm in self.vms_to_migrate:
             write_log(StaticText.MIGRATING_VM_HEADER_TEMPLATE.format(vm_name=vm.name()))
@@ -395,15 +600,10 @@ class MigrationModal(ModalScreen):
                     migration_confirmed = threading.Event()
                     user_selections = {}
 
-                    def on_custom_migration_confirm(selections: dict | None):
-                        if selections:
-                            user_selections.update(selections)
-                        migration_confirmed.set()
-
-                    self.app.call_from_thread(
+                    call_from_thread(
                         self.app.push_screen,
                         CustomMigrationModal(actions),
-                        on_custom_migration_confirm,
+                        partial(self._confirm_custom, migration_confirmed, user_selections),
                     )
 
                     # Wait for the user to interact with the modal
@@ -429,24 +629,11 @@ class MigrationModal(ModalScreen):
                         )
                     )
 
-                self.app.call_from_thread(progress_bar.advance, 1)
+                self._advance_progress()
                 continue
 
             try:
                 if self.is_live:
-                    flags = libvirt.VIR_MIGRATE_LIVE | libvirt.VIR_MIGRATE_PEER2PEER
-
-                    if copy_storage_all:
-                        flags |= libvirt.VIR_MIGRATE_NON_SHARED_DISK
-                    if unsafe:
-                        flags |= libvirt.VIR_MIGRATE_UNSAFE
-                    if persistent:
-                        flags |= libvirt.VIR_MIGRATE_PERSIST_DEST
-                    if compress:
-                        flags |= libvirt.VIR_MIGRATE_COMPRESSED
-                    if tunnelled:
-                        flags |= libvirt.VIR_MIGRATE_TUNNELLED
-
                     write_log(StaticText.LIVE_MIGRATION_FLAGS_TEMPLATE.format(flags=flags))
                     # Pass self.dest_uri as the uri argument to ensure correct port/transport is used
                     vm.migrate(self.dest_conn, flags, None, self.dest_uri, 0)
@@ -470,16 +657,10 @@ class MigrationModal(ModalScreen):
                                 error=f"Attempt to migrate guest to the same host '{src_host}'",
                             )
                         )
-                        self.app.call_from_thread(progress_bar.advance, 1)
+                        self._advance_progress()
                         continue
 
-                    flags = libvirt.VIR_MIGRATE_OFFLINE | libvirt.VIR_MIGRATE_PEER2PEER
-                    if persistent:
-                        flags |= libvirt.VIR_MIGRATE_PERSIST_DEST
-                    # VIR_MIGRATE_TUNNELLED is not applied for offline migration as it does not make sense.
-
                     if copy_storage_all:
-                        flags |= libvirt.VIR_MIGRATE_NON_SHARED_DISK
                         params = {libvirt.VIR_MIGRATE_PARAM_MIGRATE_DISKS: "*"}
                         write_log(StaticText.OFFLINE_MIGRATION_URI3)
                         vm.migrateToURI3(self.dest_uri, params, flags)
@@ -503,36 +684,37 @@ class MigrationModal(ModalScreen):
                 if StaticText.HOST_KEY_VERIFICATION_FAILED in str(e):
                     write_log(StaticText.HOST_KEY_HINT)
 
-            self.app.call_from_thread(progress_bar.advance, 1)
+            self._advance_progress()
 
         def final_ui_state():
             """Disables all controls except the Close button after migration is finished."""
-            self.query_one("#check").disabled = True
-            self.query_one("#start").disabled = True
-            self.query_one("#dest-server-select").disabled = True
-            self.query_one("#copy-storage-all").disabled = True
-            self.query_one("#unsafe").disabled = True
-            self.query_one("#persistent").disabled = True
-            self.query_one("#compress").disabled = True
-            self.query_one("#tunnelled").disabled = True
-            self.query_one("#undefine-source").disabled = True
-            self.query_one("#close").disabled = False
+            self._flush_log()
+            self._widgets["migration-progress"].styles.display = "none"
+            self.app.refresh_vm_list(force=True)
+            self._widgets["check"].disabled = True
+            self._widgets["start"].disabled = True
+            self._widgets["dest-server-select"].disabled = True
+            self._widgets["copy-storage-all"].disabled = True
+            self._widgets["unsafe"].disabled = True
+            self._widgets["persistent"].disabled = True
+            self._widgets["compress"].disabled = True
+            self._widgets["tunnelled"].disabled = True
+            self._widgets["undefine-source"].disabled = True
+            self._widgets["close"].disabled = False
 
         write_log(StaticText.MIGRATION_PROCESS_FINISHED)
-        self.app.call_from_thread(lambda: setattr(progress_bar.styles, "display", "none"))
-        self.app.call_from_thread(self.app.refresh_vm_list, force=True)
         self.app.call_from_thread(final_ui_state)
 
     @on(Checkbox.Changed, "#custom")
     def on_custom_migration_changed(self, event: Checkbox.Changed):
         """Enable or disable other migration options when custom migration is selected."""
         is_custom = event.value
-        self.query_one("#copy-storage-all").disabled = False
-        self.query_one("#copy-storage-all").value = is_custom
-        self.query_one("#unsafe").disabled = is_custom or not self.is_live
-        self.query_one("#persistent").disabled = is_custom
-        self.query_one("#compress").disabled = is_custom or not self.is_live
-        self.query_one("#tunnelled").disabled = is_custom or not self.is_live
+        self._widgets["copy-storage-all"].disabled = False
+        self._widgets["copy-storage-all"].value = is_custom
+        self._widgets["unsafe"].disabled = is_custom or not self.is_live
+        self._widgets["persistent"].disabled = is_custom
+        self._widgets["compress"].disabled = is_custom or not self.is_live
+        self._widgets["tunnelled"].disabled = is_custom or not self.is_live
 
     @on(Button.Pressed)
     def on_button_pressed(self, event: Button.Pressed):
@@ -4,13 +4,20 @@ Modals for VM Provisioning (Installation).
 
 import logging
 import os
+import stat
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
 import libvirt
 from textual import on, work
 from textual.containers import Horizontal, ScrollableContainer, Vertical
+from textual.widget import Widget
 from textual.widgets import Button, Checkbox, Collapsible, Input, Label, ProgressBar, Select
+from textual.worker import get_current_worker
 
 from ..config import load_config
 from ..constants import AppInfo, ButtonLabels, ErrorMessages, StaticText, SuccessMessages
@@ -29,10 +36,178 @@ from ..provisioning.providers.ubuntu_provider import UbuntuDistro
 from ..vm_service import VMService
 from .base_modals import BaseModal
 from .input_modals import _sanitize_domain_name
-from .template_modals import TemplateManagementModal
-from .utils_modals import FileSelectionModal
-from .vm_type_info_modal import VMTypeInfoModal
-from .vmdetails_modals import VMDetailModal
+
+# Upper bound on the threads listing ISO sources in parallel when the modal opens
+MAX_PREFETCH_WORKERS = 8
+
+# Minimum seconds between two ISO upload progress updates of the UI
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Seconds between two refreshes of the provisioning progress widgets
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+# Seconds of typing pause before the form validity is checked again
+VALIDITY_CHECK_DELAY = 0.08
+
+# Widgets looked up once on mount, by id
+_WIDGET_IDS = (
+    "vm-name",
+    "vm-type",
+    "distro",
+    "repo-iso-container",
+    "iso-select",
+    "custom-iso-container",
+    "custom-iso-path",
+    "validate-checksum",
+    "checksum-input",
+    "pool-iso-container",
+    "storage-pool-select",
+    "iso-volume-select",
+    "pool",
+    "network",
+    "expert-mode-collapsible",
+    "memory-input",
+    "cpu-input",
+    "graphics-type",
+    "disk-size-input",
+    "disk-format",
+    "boot-uefi-checkbox",
+    "automation-template-select",
+    "automation-root-password",
+    "automation-username",
+    "automation-hostname",
+    "automation-user-password",
+    "automation-language",
+    "automation-keyboard",
+    "automation-serial-console",
+    "configure-before-install-checkbox",
+    "progress-bar",
+    "status-label",
+    "install-btn",
+)
+
+# Automation user config fields, only enabled when a template is selected
+_AUTOMATION_FIELD_IDS = (
+    "automation-root-password",
+    "automation-hostname",
+    "automation-username",
+    "automation-user-password",
+    "automation-language",
+    "automation-keyboard",
+    "automation-serial-console",
+)
+
+# ISO source containers, only the one of the selected distribution is shown
+_ISO_SOURCE_CONTAINERS = ("repo-iso-container", "custom-iso-container", "pool-iso-container")
+
+# Distribution select options that do not depend on the configuration,
+# built once at import: the custom repositories go between head and tail
+_DISTRO_OPTIONS_HEAD = (
+    (StaticText.CACHED_ISOS, "cached"),
+    *((f"openSUSE: {d.value}", d) for d in OpenSUSEDistro),
+    *((f"Ubuntu: {d.value}", d) for d in UbuntuDistro),
+    *((f"Debian: {d.value}", d) for d in DebianDistro),
+    *((f"Fedora: {d.value}", d) for d in FedoraDistro),
+    *((f"Arch Linux: {d.value}", d) for d in ArchLinuxDistro),
+    *((f"Alpine Linux: {d.value}", d) for d in AlpineDistro),
+)
+_DISTRO_OPTIONS_TAIL = (
+    (StaticText.FROM_STORAGE_POOL, "pool_volumes"),
+    (StaticText.GENERIC_CUSTOM_ISO, "generic_custom"),
+)
+
+# Distribution values installed from a user-provided ISO
+_CUSTOM_ISO_DISTROS = frozenset(
+    {
+        OpenSUSEDistro.CUSTOM,
+        UbuntuDistro.CUSTOM,
+        DebianDistro.CUSTOM,
+        FedoraDistro.CUSTOM,
+        ArchLinuxDistro.CUSTOM,
+        "generic_custom",
+    }
+)
+# Distribution values offered every automation template
+_ALL_TEMPLATES_DISTROS = frozenset({"cached", "pool_volumes", "generic_custom"})
+
+# Static Select options of the VM type, expert mode and automation sections
+_VM_TYPE_OPTIONS = tuple((t.value, t) for t in VMType)
+_GRAPHICS_OPTIONS = (("Spice", "spice"), ("VNC", "vnc"))
+_DISK_FORMAT_OPTIONS = (("Qcow2", "qcow2"), ("Raw", "raw"))
+_LANGUAGE_OPTIONS = (
+    ("English (US)", "en_US"),
+    ("German", "de_DE"),
+    ("French", "fr_FR"),
+    ("Spanish", "es_ES"),
+    ("Italian", "it_IT"),
+    ("Portuguese (Brazil)", "pt_BR"),
+    ("Russian", "ru_RU"),
+    ("Japanese", "ja_JP"),
+    ("Chinese (Simplified)", "zh_CN"),
+)
+_KEYBOARD_OPTIONS = (
+    ("US", "us"),
+    ("German", "de"),
+    ("French", "fr"),
+    ("Spanish", "es"),
+    ("Italian", "it"),
+    ("Portuguese", "pt"),
+    ("Russian", "ru"),
+    ("Japanese", "jp"),
+    ("UK", "uk"),
+)
+
+# Distribution enum of each OS provider
+_DISTRO_OS_TYPES = {
+    OpenSUSEDistro: OSType.OPENSUSE,
+    UbuntuDistro: OSType.UBUNTU,
+    DebianDistro: OSType.DEBIAN,
+    FedoraDistro: OSType.FEDORA,
+    ArchLinuxDistro: OSType.ARCHLINUX,
+    AlpineDistro: OSType.ALPINE,
+}
+
+# Volume name suffixes of the ISO images offered from a storage pool
+_ISO_VOLUME_EXTENSIONS = (".iso", ".img")
+
+# Sibling OpenSUSE distributions whose ISO lists are fetched in the
+# background once one of them is shown, as users often compare them
+_PREFETCH_NEIGHBOURS = {
+    OpenSUSEDistro.LEAP: (OpenSUSEDistro.TUMBLEWEED, OpenSUSEDistro.STABLE),
+    OpenSUSEDistro.TUMBLEWEED: (OpenSUSEDistro.SLOWROLL, OpenSUSEDistro.LEAP),
+    OpenSUSEDistro.SLOWROLL: (OpenSUSEDistro.TUMBLEWEED, OpenSUSEDistro.LEAP),
+    OpenSUSEDistro.STABLE: (OpenSUSEDistro.LEAP, OpenSUSEDistro.TUMBLEWEED),
+}
+
+# Expert mode defaults by VM type: memory (GB), vCPUs, disk size (GB),
+# disk format and UEFI boot (None keeps the OS provider preference)
+_DEFAULT_EXPERT_SETTINGS = (4, 2, 8, "qcow2", None)
+_VMTYPE_DEFAULTS = {
+    VMType.COMPUTATION: (8, 4, 8, "raw", False),
+    VMType.SERVER: (4, 6, 18, "qcow2", None),
+    VMType.DESKTOP: (4, 4, 30, "qcow2", None),
+    VMType.LOW_RESOURCE: (0.5, 1, 6, "qcow2", None),
+    VMType.WDESKTOP: (16, 8, 40, "qcow2", None),
+    VMType.WLDESKTOP: (4, 4, 30, "qcow2", False),
+    VMType.SECURE: _DEFAULT_EXPERT_SETTINGS,
+}
+
+
+def _active_pool_handles(conn) -> dict[str, libvirt.virStoragePool]:
+    """Return the active storage pools of a connection by name, from the memoized pool list."""
+    return {p["name"]: p["pool"] for p in list_storage_pools(conn) if p["status"] == "active"}
+
+
+def _pool_options(pools: dict[str, libvirt.virStoragePool]) -> list[tuple[str, str]]:
+    """Return the Select options of storage pools."""
+    return [(name, name) for name in pools]
+
+
+def _default_option(options: list[tuple[str, str]]):
+    """Return "default" if it is one of the (name, name) options, else the first value."""
+    if not options:
+        return Select.NULL
+    return "default" if ("default", "default") in options else options[0][1]
 
 
 class InstallVMModal(BaseModal[str | None]):
@@ -48,16 +223,29 @@ class InstallVMModal(BaseModal[str | None]):
         self.provisioner = VMProvisioner(self.conn)
         self.template_manager = AutoYaSTTemplateManager(self.provisioner)
         self.iso_list = []
+        # Read once per modal: the pool list is memoized per connection by
+        # list_storage_pools and the custom repos only change in the config
+        self._custom_repos = self.provisioner.get_custom_repos()
+        self._pool_handles = _active_pool_handles(self.conn)
+        self._active_pools = _pool_options(self._pool_handles)
+        self._widgets: dict[str, Widget] = {}
+        self._validity_timer = None
+        # ISO options by pool name and by distribution, filled in on first use
+        self._pool_iso_options: dict[str, list[tuple[str, str]]] = {}
+        self._iso_options: dict[object, list[tuple[str, str]]] = {}
+        # Last distribution and ISO storage pool applied by the select handlers
+        self._last_distro = None
+        self._last_storage_pool = None
+        # Progress of the provisioning worker, flushed to the UI by a timer
+        self._pending_progress: tuple[str, int] | None = None
+        self._progress_lock = threading.Lock()
+        self._progress_timer = None
+        # Distributions whose neighbours were already prefetched
+        self._prefetched: set = set()
 
     def compose(self):
-        # Get Pools
-        pools = list_storage_pools(self.conn)
-        active_pools = [(p["name"], p["name"]) for p in pools if p["status"] == "active"]
-        default_pool = (
-            "default"
-            if any(p[0] == "default" for p in active_pools)
-            else (active_pools[0][1] if active_pools else Select.NULL)
-        )
+        active_pools = self._active_pools
+        default_pool = _default_option(active_pools)
 
         with ScrollableContainer(id="install-dialog"):
             yield Label(StaticText.INSTALL_VM.format(uri=self.uri), classes="title")
@@ -65,61 +253,27 @@ class InstallVMModal(BaseModal[str | None]):
 
             with Horizontal(classes="label-row"):
                 yield Select(
-                    [(t.value, t) for t in VMType],
+                    _VM_TYPE_OPTIONS,
                     value=VMType.DESKTOP,
                     id="vm-type",
                     allow_blank=False,
                 )
                 yield Button(ButtonLabels.INFO, id="vm-type-info-btn", variant="primary")
 
-            # Build distribution options - combine OpenSUSE, Ubuntu, and Debian distributions
-            distro_options = []
-
-            # Add OpenSUSE distributions
-            for d in OpenSUSEDistro:
-                distro_options.append((f"openSUSE: {d.value}", d))
-
-            # Add Ubuntu distributions
-            for d in UbuntuDistro:
-                distro_options.append((f"Ubuntu: {d.value}", d))
-
-            # Add Debian distributions
-            for d in DebianDistro:
-                distro_options.append((f"Debian: {d.value}", d))
-
-            # Add Fedora distributions
-            for d in FedoraDistro:
-                distro_options.append((f"Fedora: {d.value}", d))
-
-            # Add Arch Linux distributions
-            for d in ArchLinuxDistro:
-                distro_options.append((f"Arch Linux: {d.value}", d))
-
-            # Add Alpine Linux distributions
-            for d in AlpineDistro:
-                distro_options.append((f"Alpine Linux: {d.value}", d))
-
-            # Add Generic Custom ISO option
-            distro_options.append((StaticText.GENERIC_CUSTOM_ISO, "generic_custom"))
-
-            distro_options.insert(0, (StaticText.CACHED_ISOS, "cached"))
-            custom_repos = self.provisioner.get_custom_repos()
-            for repo in custom_repos:
+            # Cached ISOs and the distributions, then the custom repositories
+            distro_options = [
+                *_DISTRO_OPTIONS_HEAD,
                 # Use URI as value, Name as label
-                name = repo.get("name", repo["uri"])
-                uri = repo["uri"]
-                # Insert before CUSTOM option (last one usually)
-                distro_options.insert(-1, (name, uri))
-
-            # Add option to select from storage pool volumes
-            distro_options.insert(-1, (StaticText.FROM_STORAGE_POOL, "pool_volumes"))
+                *((repo.get("name", repo["uri"]), repo["uri"]) for repo in self._custom_repos),
+                *_DISTRO_OPTIONS_TAIL,
+            ]
 
             yield Select(
                 distro_options, id="distro", allow_blank=True, prompt=StaticText.DISTRIBUTION
             )
 
             # Container for ISO selection (Repo)
-            with Vertical(id="repo-iso-container"):
+            with Vertical(id="repo-iso-container", classes="hidden"):
                 yield Label(StaticText.ISO_IMAGE_REPO, classes="label")
                 config = load_config()
                 iso_path = Path(
@@ -137,7 +291,7 @@ class InstallVMModal(BaseModal[str | None]):
                 )
 
             # Container for Custom ISO
-            with Vertical(id="custom-iso-container"):
+            with Vertical(id="custom-iso-container", classes="hidden"):
                 yield Label(StaticText.CUSTOM_ISO_LOCAL_PATH, classes="label")
                 with Horizontal(classes="input-row"):
                     yield Input(
@@ -159,7 +313,7 @@ class InstallVMModal(BaseModal[str | None]):
                     yield Label(StaticText.EMPTY_LABEL, id="checksum-status", classes="status-text")
 
             # Container for ISO selection from Storage Pools
-            with Vertical(id="pool-iso-container"):
+            with Vertical(id="pool-iso-container", classes="hidden"):
                 yield Label(StaticText.SELECT_STORAGE_POOL, classes="label")
                 yield Select(
                     active_pools,
@@ -179,20 +333,16 @@ class InstallVMModal(BaseModal[str | None]):
             # Get Networks
             networks = list_networks(self.conn)
             active_networks = [(n["name"], n["name"]) for n in networks if n["active"]]
-            default_network = (
-                "default"
-                if any(n[0] == "default" for n in active_networks)
-                else (active_networks[0][1] if active_networks else Select.NULL)
-            )
+            default_network = _default_option(active_networks)
 
             with Horizontal(id="pool-network-selection"):
                 with Vertical(id="pool-selection"):
                     yield Label(StaticText.STORAGE_POOL, id="vminstall-storage-label")
-                    yield Select(active_pools, value=default_pool if default_pool else Select.NULL, id="pool", allow_blank=True if not active_pools else False)
+                    yield Select(active_pools, value=default_pool, id="pool", allow_blank=True if not active_pools else False)
                 with Vertical(id="network-selection"):
                     yield Label(StaticText.SELECT_NETWORK_PROMPT, id="vminstall-network-label")
                     yield Select(
-                        active_networks, value=default_network if default_network else Select.NULL, id="network", allow_blank=True if not active_networks else False
+                        active_networks, value=default_network, id="network", allow_blank=True if not active_networks else False
                     )
 
             with Collapsible(title=StaticText.EXPERT_MODE, id="expert-mode-collapsible"):
@@ -206,7 +356,7 @@ class InstallVMModal(BaseModal[str | None]):
                     with Vertical(id="expert-graphics"):
                         yield Label(StaticText.GRAPHICS_LABEL, classes="label")
                         yield Select(
-                            [("Spice", "spice"), ("VNC", "vnc")],
+                            _GRAPHICS_OPTIONS,
                             value="spice",
                             id="graphics-type",
                         )
@@ -216,7 +366,7 @@ class InstallVMModal(BaseModal[str | None]):
                     with Vertical(id="expert-disk-format"):
                         yield Label(StaticText.DISK_FORMAT_LABEL, classes="label")
                         yield Select(
-                            [("Qcow2", "qcow2"), ("Raw", "raw")],
+                            _DISK_FORMAT_OPTIONS,
                             value="qcow2",
                             id="disk-format",
                         )
@@ -286,17 +436,7 @@ class InstallVMModal(BaseModal[str | None]):
                         with Vertical():
                             yield Label(StaticText.LANGUAGE_LABEL, classes="label")
                             yield Select(
-                                [
-                                    ("English (US)", "en_US"),
-                                    ("German", "de_DE"),
-                                    ("French", "fr_FR"),
-                                    ("Spanish", "es_ES"),
-                                    ("Italian", "it_IT"),
-                                    ("Portuguese (Brazil)", "pt_BR"),
-                                    ("Russian", "ru_RU"),
-                                    ("Japanese", "ja_JP"),
-                                    ("Chinese (Simplified)", "zh_CN"),
-                                ],
+                                _LANGUAGE_OPTIONS,
                                 value="en_US",
                                 id="automation-language",
                                 disabled=True,
@@ -304,17 +444,7 @@ class InstallVMModal(BaseModal[str | None]):
                             )
                             yield Label(StaticText.KEYBOARD_LABEL, classes="label")
                             yield Select(
-                                [
-                                    ("US", "us"),
-                                    ("German", "de"),
-                                    ("French", "fr"),
-                                    ("Spanish", "es"),
-                                    ("Italian", "it"),
-                                    ("Portuguese", "pt"),
-                                    ("Russian", "ru"),
-                                    ("Japanese", "jp"),
-                                    ("UK", "uk"),
-                                ],
+                                _KEYBOARD_OPTIONS,
                                 value="us",
                                 id="automation-keyboard",
                                 disabled=True,
@@ -347,31 +477,28 @@ class InstallVMModal(BaseModal[str | None]):
 
     def on_mount(self):
         """Called when modal is mounted."""
-        # Initial state
-        self.query_one("#custom-iso-container").styles.display = "none"
-        self.query_one("#repo-iso-container").styles.display = "none"
-        self.query_one("#pool-iso-container").styles.display = "none"  # Hide new container
+        self._widgets = {widget_id: self.query_one(f"#{widget_id}") for widget_id in _WIDGET_IDS}
         # Ensure expert defaults are set correctly based on initial selection
-        self._update_expert_defaults(
-            self.query_one("#vm-type", Select).value, self.query_one("#distro", Select).value
-        )
+        self._update_expert_defaults(self._widgets["vm-type"].value, self._widgets["distro"].value)
 
-        # Populate initial storage pool volumes if "From Storage Pool" is default
-        storage_pool_select = self.query_one("#storage-pool-select", Select)
-        if storage_pool_select.value and storage_pool_select.value != Select.NULL:
-            self.fetch_pool_isos(storage_pool_select.value)
+        # List the local ISO sources in the background, the modal is shown at once
+        storage_pool_select = self._widgets["storage-pool-select"]
+        pool_name = storage_pool_select.value
+        self._prefetch_iso_sources(pool_name if pool_name and pool_name != Select.NULL else None)
 
         # Check if we need to create a default pool and network if none exist
         self._check_and_ensure_resources()
 
-    @work(exclusive=True, thread=True)
+    @work(exclusive=True, thread=True, group="resources")
     def _check_and_ensure_resources(self):
         """Ensures default storage pool and network exist and are active."""
         try:
             # 1. Check/Ensure Pool
             pool = ensure_default_pool(self.conn)
-            if pool:
-                # Refresh storage pool lists in the UI
+            if pool and pool.name() not in self._pool_handles:
+                # A pool was created or started: drop the memoized list and
+                # refresh storage pool lists in the UI
+                list_storage_pools.cache_clear()
                 self.app.call_from_thread(self._refresh_pool_selectors)
             
             # 2. Check/Ensure Network
@@ -393,16 +520,11 @@ class InstallVMModal(BaseModal[str | None]):
                 return
 
             # Update the network select
-            network_select = self.query_one("#network", Select)
+            network_select = self._widgets["network"]
             network_select.set_options(active_networks)
             if network_select.value == Select.NULL:
                 # Select 'default' or the first one if we just created it
-                default_network = (
-                    "default"
-                    if any(n[0] == "default" for n in active_networks)
-                    else (active_networks[0][1] if active_networks else Select.NULL)
-                )
-                network_select.value = default_network
+                network_select.value = _default_option(active_networks)
 
             self._check_form_validity()
         except Exception as e:
@@ -411,30 +533,29 @@ class InstallVMModal(BaseModal[str | None]):
     def _refresh_pool_selectors(self):
         """Refresh storage pool select widgets with new data."""
         try:
-            pools = list_storage_pools(self.conn)
-            active_pools = [(p["name"], p["name"]) for p in pools if p["status"] == "active"]
+            self._pool_handles = _active_pool_handles(self.conn)
+            active_pools = _pool_options(self._pool_handles)
+            self._active_pools = active_pools
+            self._pool_iso_options.clear()
 
             if not active_pools:
                 return
 
             # Update the main pool select
-            pool_select = self.query_one("#pool", Select)
+            pool_select = self._widgets["pool"]
             pool_select.set_options(active_pools)
             if pool_select.value == Select.NULL:
                 # Select 'default' or the first one if we just created it
-                default_pool = (
-                    "default"
-                    if any(p[0] == "default" for p in active_pools)
-                    else (active_pools[0][1] if active_pools else Select.NULL)
-                )
-                pool_select.value = default_pool
+                pool_select.value = _default_option(active_pools)
 
             # Update storage-pool-select (for ISOs)
-            storage_pool_select = self.query_one("#storage-pool-select", Select)
+            storage_pool_select = self._widgets["storage-pool-select"]
             storage_pool_select.set_options(active_pools)
             if storage_pool_select.value == Select.NULL:
                 storage_pool_select.value = active_pools[0][1]
-                # Also trigger fetching isos for it
+                # Also trigger fetching isos for it, once: the Changed event
+                # of this assignment is then a no-op
+                self._last_storage_pool = storage_pool_select.value
                 self.fetch_pool_isos(storage_pool_select.value)
 
             self._check_form_validity()
@@ -442,28 +563,10 @@ class InstallVMModal(BaseModal[str | None]):
             logging.error(f"Error refreshing pool selectors: {e}")
 
     def _update_expert_defaults(self, vm_type, distro=None):
-        mem = 4
-        vcpu = 2
-        disk_size = 8
-        disk_format = "qcow2"
-        boot_uefi = True
-
         # Determine OS type and provider preference if available
-
-        os_type = None
-        if isinstance(distro, OpenSUSEDistro):
-            os_type = OSType.OPENSUSE
-        elif isinstance(distro, UbuntuDistro):
-            os_type = OSType.UBUNTU
-        elif isinstance(distro, DebianDistro):
-            os_type = OSType.DEBIAN
-        elif isinstance(distro, FedoraDistro):
-            os_type = OSType.FEDORA
-        elif isinstance(distro, ArchLinuxDistro):
-            os_type = OSType.ARCHLINUX
-        elif isinstance(distro, AlpineDistro):
-            os_type = OSType.ALPINE
-        elif distro == "generic_custom":
+        boot_uefi = True
+        os_type = _DISTRO_OS_TYPES.get(type(distro))
+        if os_type is None and distro == "generic_custom":
             os_type = OSType.GENERIC
 
         if os_type:
@@ -471,111 +574,97 @@ class InstallVMModal(BaseModal[str | None]):
             if provider:
                 boot_uefi = provider.preferred_boot_uefi
 
-        if vm_type == VMType.COMPUTATION:
-            mem = 8
-            vcpu = 4
-            disk_format = "raw"
-            boot_uefi = False
-        elif vm_type == VMType.SERVER:
-            mem = 4
-            vcpu = 6
-            disk_size = 18
-        elif vm_type == VMType.DESKTOP:
-            mem = 4
-            vcpu = 4
-            disk_size = 30
-        elif vm_type == VMType.LOW_RESOURCE:
-            mem = 0.5
-            vcpu = 1
-            disk_size = 6
-        elif vm_type == VMType.WDESKTOP:
-            mem = 16
-            vcpu = 8
-            disk_size = 40
-        elif vm_type == VMType.WLDESKTOP:
-            mem = 4
-            vcpu = 4
-            disk_size = 30
-            boot_uefi = False
-        elif vm_type == VMType.SECURE:
-            mem = 4
-            vcpu = 2
-
-        self.query_one("#memory-input", Input).value = str(mem)
-        self.query_one("#cpu-input", Input).value = str(vcpu)
-        self.query_one("#disk-size-input", Input).value = str(disk_size)
-        self.query_one("#disk-format", Select).value = disk_format
+        mem, vcpu, disk_size, disk_format, type_uefi = _VMTYPE_DEFAULTS.get(
+            vm_type, _DEFAULT_EXPERT_SETTINGS
+        )
+        # None keeps the provider preference
+        if type_uefi is not None:
+            boot_uefi = type_uefi
+
+        self._widgets["memory-input"].value = str(mem)
+        self._widgets["cpu-input"].value = str(vcpu)
+        self._widgets["disk-size-input"].value = str(disk_size)
+        self._widgets["disk-format"].value = disk_format
 
         # Only update UEFI if it's not locked by automation
-        uefi_checkbox = self.query_one("#boot-uefi-checkbox", Checkbox)
+        uefi_checkbox = self._widgets["boot-uefi-checkbox"]
         if not uefi_checkbox.disabled:
             uefi_checkbox.value = boot_uefi
 
     @on(Select.Changed, "#vm-type")
     def on_vm_type_changed(self, event: Select.Changed):
-        self._update_expert_defaults(event.value, self.query_one("#distro", Select).value)
+        self._update_expert_defaults(event.value, self._widgets["distro"].value)
 
     @on(Select.Changed, "#distro")
     def on_distro_changed(self, event: Select.Changed):
-        self.query_one("#expert-mode-collapsible", Collapsible).collapsed = True
-        self._update_expert_defaults(self.query_one("#vm-type", Select).value, event.value)
-
-        # Hide all ISO source containers first
-        self.query_one("#custom-iso-container").styles.display = "none"
-        self.query_one("#repo-iso-container").styles.display = "none"
-        self.query_one("#pool-iso-container").styles.display = "none"
-
-        if event.value in [
-            OpenSUSEDistro.CUSTOM,
-            UbuntuDistro.CUSTOM,
-            DebianDistro.CUSTOM,
-            FedoraDistro.CUSTOM,
-            ArchLinuxDistro.CUSTOM,
-            "generic_custom",
-        ]:
-            self.query_one("#custom-iso-container").styles.display = "block"
-        elif event.value == "pool_volumes":
-            self.query_one("#repo-iso-container").styles.display = "none"
-            self.query_one("#custom-iso-container").styles.display = "none"
-            self.query_one("#pool-iso-container").styles.display = "block"
+        # A Changed repeating the applied distribution has nothing to redo
+        if event.value == self._last_distro:
+            return
+        self._last_distro = event.value
+        # One repaint for the whole switch of ISO source
+        with self.app.batch_update():
+            self._switch_distro(event.value)
+
+    def _switch_distro(self, distro):
+        self._widgets["expert-mode-collapsible"].collapsed = True
+        self._update_expert_defaults(self._widgets["vm-type"].value, distro)
+
+        if distro in _CUSTOM_ISO_DISTROS:
+            shown_container = "custom-iso-container"
+        elif distro == "pool_volumes":
+            shown_container = "pool-iso-container"
+        else:  # Repo or Cached
+            shown_container = "repo-iso-container"
+        # Only the containers whose visibility changes are restyled
+        for container_id in _ISO_SOURCE_CONTAINERS:
+            self._widgets[container_id].set_class(container_id != shown_container, "hidden")
+
+        if shown_container != "repo-iso-container":
+            # A repository list still being fetched is no longer wanted
+            self.workers.cancel_group(self, "iso-list")
+            self._update_iso_status("", False)
+
+        if distro == "pool_volumes":
             # Trigger fetching volumes for the currently selected storage pool
-            pool_select = self.query_one("#storage-pool-select", Select)
+            pool_select = self._widgets["storage-pool-select"]
             if pool_select.value and pool_select.value != Select.NULL:
                 self.fetch_pool_isos(pool_select.value)
             else:
                 # If no pool is selected, clear the ISO volume select and keep it disabled
-                iso_volume_select = self.query_one("#iso-volume-select", Select)
+                iso_volume_select = self._widgets["iso-volume-select"]
                 iso_volume_select.clear()
                 iso_volume_select.disabled = True
-        else:  # Repo or Cached
-            self.query_one("#repo-iso-container").styles.display = "block"
-            self.fetch_isos(event.value)
+        elif shown_container == "repo-iso-container":
+            self.fetch_isos(distro)
 
         # Populate templates based on the selected distribution
-        self._populate_templates_for_distribution(event.value)
+        self._populate_templates_for_distribution(distro)
 
         self._check_form_validity()
 
     @on(Checkbox.Changed, "#validate-checksum")
     def on_checksum_toggle(self, event: Checkbox.Changed):
-        self.query_one("#checksum-input").disabled = not event.value
+        self._widgets["checksum-input"].disabled = not event.value
 
     @on(Input.Changed, "#custom-iso-path")
     def on_custom_path_changed(self):
-        self._check_form_validity()
+        self._schedule_validity_check()
 
     @on(Input.Changed, "#checksum-input")
     def on_checksum_changed(self):
-        self._check_form_validity()
+        self._schedule_validity_check()
 
     @on(Select.Changed, "#storage-pool-select")
     def on_storage_pool_selected(self, event: Select.Changed):
         """Handles when a storage pool is selected for ISO volumes."""
+        if event.value == self._last_storage_pool:
+            return
+        self._last_storage_pool = event.value
         if event.value and event.value != Select.NULL:
             self.fetch_pool_isos(event.value)
         else:
             # No pool selected, clear volumes and disable the volume select
-            iso_volume_select = self.query_one("#iso-volume-select", Select)
+            iso_volume_select = self._widgets["iso-volume-select"]
             iso_volume_select.clear()
             iso_volume_select.disabled = True
         self._check_form_validity()
@@ -585,83 +674,150 @@ class InstallVMModal(BaseModal[str | None]):
         """Handles when an ISO volume is selected."""
         self._check_form_validity()
 
-    @work(exclusive=True, thread=True)
+    def _list_pool_iso_options(self, pool_name: str) -> list[tuple[str, str]]:
+        """Return the ISO volume options of a storage pool, listing them once per modal."""
+        iso_volumes_options = self._pool_iso_options.get(pool_name)
+        if iso_volumes_options is not None:
+            return iso_volumes_options
+
+        # Only active pools are offered, so no per-pool isActive() round trip
+        pool = self._pool_handles.get(pool_name)
+        if pool is None:
+            raise Exception(
+                ErrorMessages.STORAGE_POOL_NOT_ACTIVE_TEMPLATE.format(pool_name=pool_name)
+            )
+        volumes = pool.listAllVolumes(0)
+
+        # ISO images are recognized by their name: the content type is
+        # not known to libvirt without reading the volume
+        # vol.name() is a libvirt call, made once per volume
+        iso_volumes_options = []
+        for vol in volumes:
+            name = vol.name()
+            if name.lower().endswith(_ISO_VOLUME_EXTENSIONS):
+                iso_volumes_options.append((name, vol.path()))
+        iso_volumes_options.sort(key=itemgetter(0))  # Sort by name
+        self._pool_iso_options[pool_name] = iso_volumes_options
+        return iso_volumes_options
+
+    def _list_iso_options(
+        self, distro: OpenSUSEDistro | UbuntuDistro | DebianDistro | str
+    ) -> list[tuple[str, str]]:
+        """Return the ISO options of a distribution, fetching them once per modal."""
+        iso_options = self._iso_options.get(distro)
+        if iso_options is not None:
+            return iso_options
+
+        if distro == "cached":
+            isos = self.provisioner.get_cached_isos()
+        else:
+            isos = self.provisioner.get_iso_list(distro)
+
+        # Create Select options: (label, url)
+        iso_options = [
+            (f"{iso['name']} ({iso['date']})" if iso.get("date") else iso["name"], iso["url"])
+            for iso in isos
+        ]
+
+        self._iso_options[distro] = iso_options
+        return iso_options
+
+    def _show_pool_iso_options(self, iso_volumes_options: list[tuple[str, str]]):
+        """Fill the ISO volume select with the volumes of the selected pool."""
+        iso_volume_select = self._widgets["iso-volume-select"]
+        if iso_volumes_options:
+            iso_volume_select.set_options(iso_volumes_options)
+            iso_volume_select.value = iso_volumes_options[0][1]  # Select first
+            iso_volume_select.disabled = False
+        else:
+            iso_volume_select.clear()
+            iso_volume_select.disabled = True
+        self._check_form_validity()
+
+    @work(thread=True, group="iso-prefetch")
+    def _prefetch_iso_sources(self, pool_name: str | None):
+        """
+        List the cached ISOs and the ISO volumes of every active storage pool
+        in parallel, so picking a source or switching pools shows its list at
+        once. The volumes of the initial pool are shown as soon as they are in.
+        """
+        pool_names = list(self._pool_handles)
+        max_workers = min(MAX_PREFETCH_WORKERS, len(pool_names) + 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # None stands for the cached ISOs, anything else is a pool name
+            futures = {executor.submit(self._list_iso_options, "cached"): None}
+            for name in pool_names:
+                futures[executor.submit(self._list_pool_iso_options, name)] = name
+            for future in as_completed(futures):
+                source = futures[future]
+                if future.exception():
+                    logging.debug(
+                        "Could not prefetch ISOs from %s: %s",
+                        source or "the cache",
+                        future.exception(),
+                    )
+                elif source is not None and source == pool_name:
+                    self.app.call_from_thread(
+                        self._show_prefetched_pool_isos, source, future.result()
+                    )
+
+    def _show_prefetched_pool_isos(
+        self, pool_name: str, iso_volumes_options: list[tuple[str, str]]
+    ):
+        """Show prefetched volumes unless the user has switched pools meanwhile."""
+        if self._widgets["storage-pool-select"].value != pool_name:
+            return
+        self._show_pool_iso_options(iso_volumes_options)
+
+    @work(exclusive=True, thread=True, group="pool-isos")
     def fetch_pool_isos(self, pool_name: str):
         """Fetches and populates the list of ISO volumes in a given storage pool."""
-        self.app.call_from_thread(
-            self._update_iso_status,
-            StaticText.FETCHING_ISO_VOLUMES_FROM_TEMPLATE.format(pool_name=pool_name),
-            True,
-        )
-        iso_volume_select = self.query_one("#iso-volume-select", Select)
+        if pool_name not in self._pool_iso_options:
+            self.app.call_from_thread(
+                self._update_iso_status,
+                StaticText.FETCHING_ISO_VOLUMES_FROM_TEMPLATE.format(pool_name=pool_name),
+                True,
+            )
         try:
-            pool = self.conn.storagePoolLookupByName(pool_name)
-            if not pool.isActive():
-                raise Exception(
-                    ErrorMessages.STORAGE_POOL_NOT_ACTIVE_TEMPLATE.format(pool_name=pool_name)
-                )
-            volumes = pool.listAllVolumes(0) if pool else []
-
-            iso_volumes_options = []
-            for vol in volumes:
-                # Filter for ISO images - often ending in .iso or .img
-                # This is a heuristic, actual content type is harder to determine without reading
-                if vol.name().lower().endswith((".iso", ".img")):
-                    iso_volumes_options.append(
-                        (vol.name(), vol.path())
-                    )  # Display name, store full path
-
-            iso_volumes_options.sort(key=lambda x: x[0])  # Sort by name
+            iso_volumes_options = self._list_pool_iso_options(pool_name)
 
             def update_iso_volume_select():
-                if iso_volumes_options:
-                    iso_volume_select.set_options(iso_volumes_options)
-                    iso_volume_select.value = iso_volumes_options[0][1]  # Select first
-                    iso_volume_select.disabled = False
-                else:
-                    iso_volume_select.clear()
-                    iso_volume_select.disabled = True
                 self._update_iso_status("", False)
-                self._check_form_validity()
+                self._show_pool_iso_options(iso_volumes_options)
 
             self.app.call_from_thread(update_iso_volume_select)
 
         except Exception as e:
-            self.app.call_from_thread(
-                self.app.show_error_message,
-                ErrorMessages.FAILED_TO_FETCH_ISO_VOLUMES_TEMPLATE.format(
-                    pool_name=pool_name, error=e
-                ),
+            # `e` is unbound once the except block ends, so format it now
+            message = ErrorMessages.FAILED_TO_FETCH_ISO_VOLUMES_TEMPLATE.format(
+                pool_name=pool_name, error=e
             )
-            self.app.call_from_thread(
-                self._update_iso_status, StaticText.ERROR_FETCHING_VOLUMES, False
-            )
-            self.app.call_from_thread(iso_volume_select.clear)
-            self.app.call_from_thread(lambda: setattr(iso_volume_select, "disabled", True))
 
-    @work(exclusive=True, thread=True)
-    def fetch_isos(self, distro: OpenSUSEDistro | UbuntuDistro | DebianDistro | str):
-        self.app.call_from_thread(self._update_iso_status, StaticText.FETCHING_ISO_LIST, True)
+            # All the UI changes of the failure in one trip to the UI thread
+            def apply_error_state(message):
+                self.app.show_error_message(message)
+                self._update_iso_status(StaticText.ERROR_FETCHING_VOLUMES, False)
+                iso_volume_select = self._widgets["iso-volume-select"]
+                iso_volume_select.clear()
+                iso_volume_select.disabled = True
 
-        try:
-            isos = []
-            if distro == "cached":
-                isos = self.provisioner.get_cached_isos()
-            else:
-                isos = self.provisioner.get_iso_list(distro)
+            self.app.call_from_thread(apply_error_state, message)
 
-            # Create Select options: (label, url)
-            iso_options = []
-            for iso in isos:
-                name = iso["name"]
-                url = iso["url"]
-                date = iso.get("date", "")
+    @work(exclusive=True, thread=True, group="iso-list")
+    def fetch_isos(self, distro: OpenSUSEDistro | UbuntuDistro | DebianDistro | str):
+        if distro not in self._iso_options:
+            self.app.call_from_thread(self._update_iso_status, StaticText.FETCHING_ISO_LIST, True)
 
-                label = f"{name} ({date})" if date else name
-                iso_options.append((label, url))
+        worker = get_current_worker()
+        try:
+            iso_options = self._list_iso_options(distro)
+            # Another source was picked meanwhile: the list stays memoized
+            # for later, but must not replace what the user now sees
+            if worker.is_cancelled:
+                return
 
             def update_select():
-                sel = self.query_one("#iso-select", Select)
+                sel = self._widgets["iso-select"]
                 sel.set_options(iso_options)
                 sel.disabled = False
                 if iso_options:
@@ -672,26 +828,41 @@ class InstallVMModal(BaseModal[str | None]):
                 self._check_form_validity()  # Re-check validity after options change
 
             self.app.call_from_thread(update_select)
+            if distro in _PREFETCH_NEIGHBOURS and distro not in self._prefetched:
+                self._prefetched.add(distro)
+                self.app.call_from_thread(self._prefetch_neighbours, distro)
 
         except Exception as e:
-            self.app.call_from_thread(
-                self.app.show_error_message,
-                ErrorMessages.FAILED_TO_FETCH_ISOS_TEMPLATE.format(error=e),
-            )
-            self.app.call_from_thread(
-                self._update_iso_status, StaticText.ERROR_FETCHING_ISOS, False
-            )
+            if worker.is_cancelled:
+                return
+
+            message = ErrorMessages.FAILED_TO_FETCH_ISOS_TEMPLATE.format(error=e)
+
+            def apply_error_state(message):
+                self.app.show_error_message(message)
+                self._update_iso_status(StaticText.ERROR_FETCHING_ISOS, False)
+
+            self.app.call_from_thread(apply_error_state, message)
+
+    @work(thread=True, group="iso-prefetch")
+    def _prefetch_neighbours(self, distro: OpenSUSEDistro):
+        """Fetch the ISO lists of the siblings of a distribution, without touching the UI."""
+        for neighbour in _PREFETCH_NEIGHBOURS[distro]:
+            if neighbour in self._iso_options:
+                continue
+            try:
+                self._list_iso_options(neighbour)
+            except Exception as e:
+                logging.debug("Could not prefetch ISOs of %s: %s", neighbour.value, e)
 
     def _update_iso_status(self, message, loading):
-        lbl = self.query_one("#status-label", Label)
+        lbl = self._widgets["status-label"]
         if message:
             lbl.update(message)
-            lbl.styles.display = "block"
-        else:
-            lbl.styles.display = "none"
+        lbl.set_class(not message, "hidden")
 
         # Disable install while fetching
-        self.query_one("#install-btn", Button).disabled = loading
+        self._widgets["install-btn"].disabled = loading
 
     def _populate_templates_for_distribution(
         self, distro: OpenSUSEDistro | UbuntuDistro | DebianDistro | str
@@ -976,7 +1147,7 @@ class InstallVMModal(BaseModal[str | None]):
                             filtered_templates.append(template)
 
         elif isinstance(distro, str):
-            if distro in ["cached", "pool_volumes", "generic_custom"]:
+            if distro in _ALL_TEMPLATES_DISTROS:
                 # Cached ISOs, pool volumes or Generic Custom ISO → Show ALL templates
                 filtered_templates = all_templates
             else:
@@ -1011,14 +1182,14 @@ class InstallVMModal(BaseModal[str | None]):
 
         # Build select options
         template_options = [("None", None)]  # Default: no automation
-        for template in filtered_templates:
-            label = template["display_name"]
-            # Use template_id for user templates, filename for built-in
-            value = template.get("template_id") or template["filename"]
-            template_options.append((label, value))
+        # Use template_id for user templates, filename for built-in
+        template_options.extend(
+            (template["display_name"], template.get("template_id") or template["filename"])
+            for template in filtered_templates
+        )
 
         # Update the select widget
-        template_select = self.query_one("#automation-template-select", Select)
+        template_select = self._widgets["automation-template-select"]
         template_select.set_options(template_options)
         template_select.value = None  # Reset to "None"
 
@@ -1036,25 +1207,20 @@ class InstallVMModal(BaseModal[str | None]):
 
         # Update all automation user config fields
         try:
-            self.query_one("#automation-root-password", Input).disabled = not should_enable
-            self.query_one("#automation-hostname", Input).disabled = not should_enable
-            self.query_one("#automation-username", Input).disabled = not should_enable
-            self.query_one("#automation-user-password", Input).disabled = not should_enable
-            self.query_one("#automation-language", Select).disabled = not should_enable
-            self.query_one("#automation-keyboard", Select).disabled = not should_enable
-            self.query_one("#automation-serial-console", Checkbox).disabled = not should_enable
+            for widget_id in _AUTOMATION_FIELD_IDS:
+                self._widgets[widget_id].disabled = not should_enable
 
             # If automation is enabled, prefill fields from config
             if should_enable:
                 self._prefill_automation_fields()
 
             # Enforce UEFI for automated installations (except for Alpine Linux)
-            distro = self.query_one("#distro", Select).value
+            distro = self._widgets["distro"].value
             is_alpine = isinstance(distro, AlpineDistro) or (
                 isinstance(distro, str) and "alpine" in distro.lower()
             )
 
-            uefi_checkbox = self.query_one("#boot-uefi-checkbox", Checkbox)
+            uefi_checkbox = self._widgets["boot-uefi-checkbox"]
             if should_enable:
                 if is_alpine:
                     uefi_checkbox.value = False
@@ -1065,12 +1231,10 @@ class InstallVMModal(BaseModal[str | None]):
                 uefi_checkbox.disabled = False
 
             # Hide "Configure before install" for automated installations
-            configure_checkbox = self.query_one("#configure-before-install-checkbox", Checkbox)
+            configure_checkbox = self._widgets["configure-before-install-checkbox"]
+            configure_checkbox.set_class(should_enable, "hidden")
             if should_enable:
-                configure_checkbox.styles.display = "none"
                 configure_checkbox.value = False  # Uncheck it when hidden
-            else:
-                configure_checkbox.styles.display = "block"
         except Exception as e:
             # Widgets may not exist in all contexts
             logging.warning(f"Could not update automation config fields: {e}")
@@ -1079,11 +1243,11 @@ class InstallVMModal(BaseModal[str | None]):
     def on_name_changed(self, event: Input.Changed):
         # Synchronize with hostname in automated installation
         try:
-            hostname_input = self.query_one("#automation-hostname", Input)
+            hostname_input = self._widgets["automation-hostname"]
             hostname_input.value = event.value
         except Exception:
             pass
-        self._check_form_validity()
+        self._schedule_validity_check()
 
     def _prefill_automation_fields(self):
         """Prefill automation fields from user configuration."""
@@ -1094,22 +1258,22 @@ class InstallVMModal(BaseModal[str | None]):
             # Prefill root password
             root_password = prefill_config.get("root_password", "")
             if root_password:
-                self.query_one("#automation-root-password", Input).value = root_password
+                self._widgets["automation-root-password"].value = root_password
 
             # Prefill username
             username = prefill_config.get("username", "")
             if username:
-                self.query_one("#automation-username", Input).value = username
+                self._widgets["automation-username"].value = username
 
             # Prefill user password
             user_password = prefill_config.get("user_password", "")
             if user_password:
-                self.query_one("#automation-user-password", Input).value = user_password
+                self._widgets["automation-user-password"].value = user_password
 
             # Prefill keyboard layout
             keyboard = prefill_config.get("keyboard", "")
             if keyboard:
-                keyboard_select = self.query_one("#automation-keyboard", Select)
+                keyboard_select = self._widgets["automation-keyboard"]
                 # Find matching keyboard option by value
                 for option_text, option_value in keyboard_select._options:
                     if option_value == keyboard:
@@ -1119,7 +1283,7 @@ class InstallVMModal(BaseModal[str | None]):
             # Prefill language
             language = prefill_config.get("language", "")
             if language:
-                language_select = self.query_one("#automation-language", Select)
+                language_select = self._widgets["automation-language"]
                 # Find matching language option by display text or value
                 for option_text, option_value in language_select._options:
                     if option_text == language or option_value == language:
@@ -1129,7 +1293,7 @@ class InstallVMModal(BaseModal[str | None]):
             # Prefill language
             language = prefill_config.get("language", "")
             if language:
-                language_select = self.query_one("#automation-language", Select)
+                language_select = self._widgets["automation-language"]
                 # Find matching language option by display text or value
                 for option in language_select._options:
                     if hasattr(option, "prompt") and hasattr(option, "value"):
@@ -1141,33 +1305,33 @@ class InstallVMModal(BaseModal[str | None]):
             # Log but don't fail - prefilling is optional functionality
             logging.warning(f"Could not prefill automation fields from config: {e}")
 
+    def _schedule_validity_check(self):
+        """Check the form once typing pauses, instead of on every keystroke."""
+        if self._validity_timer:
+            self._validity_timer.stop()
+        self._validity_timer = self.set_timer(VALIDITY_CHECK_DELAY, self._run_validity_check)
+
+    def _run_validity_check(self):
+        self._validity_timer = None
+        self._check_form_validity()
+
     def _check_form_validity(self):
-        name = self.query_one("#vm-name", Input).value.strip()
-        distro = self.query_one("#distro", Select).value
-
-        valid_iso = False
-        if distro in [
-            OpenSUSEDistro.CUSTOM,
-            UbuntuDistro.CUSTOM,
-            DebianDistro.CUSTOM,
-            FedoraDistro.CUSTOM,
-            ArchLinuxDistro.CUSTOM,
-            "generic_custom",
-        ]:
-            path = self.query_one("#custom-iso-path", Input).value.strip()
-            valid_iso = bool(path)  # Basic check, validation happens on install
-        elif distro == "pool_volumes":
-            iso_volume = self.query_one("#iso-volume-select", Select).value
-            valid_iso = iso_volume and iso_volume != Select.NULL
-        else:
-            iso = self.query_one("#iso-select", Select).value
-            valid_iso = iso and iso != Select.NULL
+        btn = self._widgets["install-btn"]
+        # A missing name is the usual invalid state: no ISO widget is read then
+        if not self._widgets["vm-name"].value.strip():
+            btn.disabled = True
+            return
 
-        btn = self.query_one("#install-btn", Button)
-        if name and valid_iso:
-            btn.disabled = False
+        distro = self._widgets["distro"].value
+        if distro in _CUSTOM_ISO_DISTROS:
+            # Basic check, validation happens on install
+            valid_iso = bool(self._widgets["custom-iso-path"].value.strip())
         else:
-            btn.disabled = True
+            iso_select_id = "iso-volume-select" if distro == "pool_volumes" else "iso-select"
+            iso = self._widgets[iso_select_id].value
+            valid_iso = bool(iso) and iso != Select.NULL
+
+        btn.disabled = not valid_iso
 
     @on(Button.Pressed, "#cancel-btn")
     def on_cancel(self):
@@ -1176,10 +1340,11 @@ class InstallVMModal(BaseModal[str | None]):
     @on(Button.Pressed, "#browse-iso-btn")
     def on_browse_iso(self):
         """Open file picker for Custom ISO."""
+        from .utils_modals import FileSelectionModal
 
         def set_path(path: str | None) -> None:
             if path:
-                self.query_one("#custom-iso-path", Input).value = path
+                self._widgets["custom-iso-path"].value = path
                 self._check_form_validity()
 
         self.app.push_screen(FileSelectionModal(), set_path)
@@ -1187,16 +1352,19 @@ class InstallVMModal(BaseModal[str | None]):
     @on(Button.Pressed, "#vm-type-info-btn")
     def on_vm_type_info(self):
         """Show VM Type info modal."""
+        from .vm_type_info_modal import VMTypeInfoModal
+
         self.app.push_screen(VMTypeInfoModal())
 
     @on(Button.Pressed, "#manage-templates-btn")
     def on_manage_templates(self):
         """Open the template management modal."""
+        from .template_modals import TemplateManagementModal
 
         def on_template_modal_close(result: bool | None):
             # When template management modal closes, refresh the template list
             # in case templates were added, edited, or deleted
-            distro = self.query_one("#distro", Select).value
+            distro = self._widgets["distro"].value
             if distro:
                 self._populate_templates_for_distribution(distro)
 
@@ -1206,7 +1374,7 @@ class InstallVMModal(BaseModal[str | None]):
 
     @on(Button.Pressed, "#install-btn")
     def on_install(self):
-        vm_name_raw = self.query_one("#vm-name", Input).value
+        vm_name_raw = self._widgets["vm-name"].value
 
         # 1. Sanitize VM Name
         try:
@@ -1221,39 +1389,18 @@ class InstallVMModal(BaseModal[str | None]):
                     original=vm_name_raw, sanitized=vm_name
                 )
             )
-            self.query_one("#vm-name", Input).value = vm_name
+            self._widgets["vm-name"].value = vm_name
 
         if not vm_name:
             self.app.show_error_message(ErrorMessages.VM_NAME_CANNOT_BE_EMPTY)
             return
 
-        # 2. Check if VM exists
-        try:
-            self.conn.lookupByName(vm_name)
-            self.app.show_error_message(
-                ErrorMessages.VM_NAME_ALREADY_EXISTS_TEMPLATE.format(vm_name=vm_name)
-            )
-            return
-        except libvirt.libvirtError as e:
-            if e.get_error_code() != libvirt.VIR_ERR_NO_DOMAIN:
-                self.app.show_error_message(
-                    ErrorMessages.ERROR_CHECKING_VM_NAME_TEMPLATE.format(error=e)
-                )
-                return
-        except Exception as e:
-            self.app.show_error_message(
-                ErrorMessages.UNEXPECTED_ERROR_OCCURRED_TEMPLATE.format(error=e)
-            )
-            return
-
-        vm_type = self.query_one("#vm-type", Select).value
-        pool_name = self.query_one("#pool", Select).value
-        network_name = self.query_one("#network", Select).value
-        distro = self.query_one("#distro", Select).value
-        serial_console = self.query_one("#automation-serial-console", Checkbox).value
-        configure_before_install = self.query_one(
-            "#configure-before-install-checkbox", Checkbox
-        ).value
+        vm_type = self._widgets["vm-type"].value
+        pool_name = self._widgets["pool"].value
+        network_name = self._widgets["network"].value
+        distro = self._widgets["distro"].value
+        serial_console = self._widgets["automation-serial-console"].value
+        configure_before_install = self._widgets["configure-before-install-checkbox"].value
 
         # Validate storage pool
         if not pool_name or pool_name == Select.NULL:
@@ -1265,20 +1412,13 @@ class InstallVMModal(BaseModal[str | None]):
         checksum = None
         validate = False
 
-        if distro in [
-            OpenSUSEDistro.CUSTOM,
-            UbuntuDistro.CUSTOM,
-            DebianDistro.CUSTOM,
-            FedoraDistro.CUSTOM,
-            ArchLinuxDistro.CUSTOM,
-            "generic_custom",
-        ]:
-            custom_path = self.query_one("#custom-iso-path", Input).value.strip()
-            validate = self.query_one("#validate-checksum", Checkbox).value
+        if distro in _CUSTOM_ISO_DISTROS:
+            custom_path = self._widgets["custom-iso-path"].value.strip()
+            validate = self._widgets["validate-checksum"].value
             if validate:
-                checksum = self.query_one("#checksum-input", Input).value.strip()
+                checksum = self._widgets["checksum-input"].value.strip()
         elif distro == "pool_volumes":
-            iso_url = self.query_one("#iso-volume-select", Select).value
+            iso_url = self._widgets["iso-volume-select"].value
             if not iso_url or iso_url == Select.NULL:
                 self.app.show_error_message(ErrorMessages.SELECT_VALID_ISO_VOLUME)
                 return
@@ -1289,17 +1429,17 @@ class InstallVMModal(BaseModal[str | None]):
                 )
                 return
         else:
-            iso_url = self.query_one("#iso-select", Select).value
+            iso_url = self._widgets["iso-select"].value
 
         # Expert Mode Settings
         try:
-            memory_gb = int(self.query_one("#memory-input", Input).value)
+            memory_gb = int(self._widgets["memory-input"].value)
             memory_mb = memory_gb * 1024
-            vcpu = int(self.query_one("#cpu-input", Input).value)
-            disk_size = int(self.query_one("#disk-size-input", Input).value)
-            disk_format = self.query_one("#disk-format", Select).value
-            graphics_type = self.query_one("#graphics-type", Select).value
-            boot_uefi = self.query_one("#boot-uefi-checkbox", Checkbox).value
+            vcpu = int(self._widgets["cpu-input"].value)
+            disk_size = int(self._widgets["disk-size-input"].value)
+            disk_format = self._widgets["disk-format"].value
+            graphics_type = self._widgets["graphics-type"].value
+            boot_uefi = self._widgets["boot-uefi-checkbox"].value
         except ValueError:
             self.app.show_error_message(ErrorMessages.INVALID_EXPERT_SETTINGS)
             return
@@ -1307,7 +1447,7 @@ class InstallVMModal(BaseModal[str | None]):
         # Get automation template selection
         automation_template_id = None
         try:
-            template_select = self.query_one("#automation-template-select", Select)
+            template_select = self._widgets["automation-template-select"]
             if template_select.value and template_select.value != Select.NULL:
                 automation_template_id = template_select.value
         except Exception:
@@ -1325,53 +1465,114 @@ class InstallVMModal(BaseModal[str | None]):
             self.app.show_error_message(ErrorMessages.DISK_SIZE_RANGE_ERROR)
             return
 
+        # Existence of the VM and state of the pool are checked off the UI thread
+        self._widgets["install-btn"].disabled = True
+        self._preflight_and_install(
+            vm_name,
+            pool_name,
+            (
+                vm_name,
+                vm_type,
+                iso_url,
+                pool_name,
+                custom_path,
+                validate,
+                checksum,
+                memory_mb,
+                vcpu,
+                disk_size,
+                disk_format,
+                graphics_type,
+                boot_uefi,
+                serial_console,
+                configure_before_install,
+                automation_template_id,
+                network_name,
+            ),
+        )
+
+    @work(exclusive=True, thread=True, group="install")
+    def _preflight_and_install(self, vm_name: str, pool_name: str, provisioning_args: tuple):
+        """Check the VM name and storage pool with libvirt, then start the provisioning."""
+
+        def fail(message: str):
+            def apply_error_state():
+                self.app.show_error_message(message)
+                self._check_form_validity()
+
+            self.app.call_from_thread(apply_error_state)
+
+        # 1. Check if VM exists
         try:
-            pool = self.conn.storagePoolLookupByName(pool_name)
-            if not pool.isActive():
-                self.app.show_error_message(
-                    ErrorMessages.STORAGE_POOL_NOT_ACTIVE_TEMPLATE.format(pool_name=pool_name)
-                )
+            self.conn.lookupByName(vm_name)
+        except libvirt.libvirtError as e:
+            if e.get_error_code() != libvirt.VIR_ERR_NO_DOMAIN:
+                fail(ErrorMessages.ERROR_CHECKING_VM_NAME_TEMPLATE.format(error=e))
                 return
         except Exception as e:
-            self.app.show_error_message(
+            fail(ErrorMessages.UNEXPECTED_ERROR_OCCURRED_TEMPLATE.format(error=e))
+            return
+        else:
+            fail(ErrorMessages.VM_NAME_ALREADY_EXISTS_TEMPLATE.format(vm_name=vm_name))
+            return
+
+        # 2. Pools listed active by the modal need no lookup or isActive() round trip
+        try:
+            if pool_name not in self._pool_handles:
+                pool = self.conn.storagePoolLookupByName(pool_name)
+                if not pool.isActive():
+                    fail(ErrorMessages.STORAGE_POOL_NOT_ACTIVE_TEMPLATE.format(pool_name=pool_name))
+                    return
+        except Exception as e:
+            fail(
                 ErrorMessages.ERROR_ACCESSING_STORAGE_POOL_TEMPLATE.format(
                     pool_name=pool_name, error=e
                 )
             )
             return
 
-        # Disable inputs
-        for widget in self.query("Input"):
-            widget.disabled = True
-        for widget in self.query("Select"):
-            widget.disabled = True
-        for widget in self.query("Button"):
+        self.app.call_from_thread(self._start_provisioning, provisioning_args)
+
+    def _start_provisioning(self, provisioning_args: tuple):
+        # Disable inputs, in one walk of the widget tree
+        for widget in self.query("Input, Select, Button"):
             widget.disabled = True
-        self.query_one("#configure-before-install-checkbox", Checkbox).disabled = True
-        self.query_one("#progress-bar").styles.display = "block"
-        self.query_one("#status-label").styles.display = "block"
+        self._widgets["configure-before-install-checkbox"].disabled = True
+        self._widgets["progress-bar"].styles.display = "block"
+        self._widgets["status-label"].remove_class("hidden")
 
-        self.run_provisioning(
-            vm_name,
-            vm_type,
-            iso_url,
-            pool_name,
-            custom_path,
-            validate,
-            checksum,
-            memory_mb,
-            vcpu,
-            disk_size,
-            disk_format,
-            graphics_type,
-            boot_uefi,
-            serial_console,
-            configure_before_install,
-            automation_template_id,
-            network_name,
-        )
+        if self._progress_timer is None:
+            self._progress_timer = self.set_interval(PROGRESS_FLUSH_INTERVAL, self._flush_progress)
+        self.run_provisioning(*provisioning_args)
 
-    @work(exclusive=True, thread=True)
+    def _stop_progress_flush(self) -> None:
+        """Stop the progress timer after showing the last queued progress."""
+        if self._progress_timer is None:
+            return
+        self._progress_timer.stop()
+        self._progress_timer = None
+        self._flush_progress()
+
+    def on_unmount(self) -> None:
+        """Stop the progress timer when the modal is dismissed."""
+        self._stop_progress_flush()
+
+    def _queue_progress(self, stage: str, percent: int) -> None:
+        """Queue the provisioning progress for the UI; safe to call from any thread."""
+        with self._progress_lock:
+            self._pending_progress = (stage, percent)
+
+    def _flush_progress(self) -> None:
+        """Show the latest queued progress, if any, on the label and the bar."""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+        if pending:
+            stage, percent = pending
+            self._widgets["status-label"].update(stage)
+            self._widgets["progress-bar"].update(progress=percent)
+
+    @work(exclusive=True, thread=True, group="install")
     def run_provisioning(
         self,
         name,
@@ -1392,12 +1593,8 @@ class InstallVMModal(BaseModal[str | None]):
         automation_template_id,
         network_name,
     ):
-        p_bar = self.query_one("#progress-bar", ProgressBar)
-        status_lbl = self.query_one("#status-label", Label)
-
-        def progress_cb(stage, percent):
-            self.app.call_from_thread(status_lbl.update, stage)
-            self.app.call_from_thread(p_bar.update, progress=percent)
+        # Queued without waiting for the UI thread, shown by a timer
+        progress_cb = self._queue_progress
 
         try:
             final_iso_url = iso_url
@@ -1428,14 +1625,16 @@ class InstallVMModal(BaseModal[str | None]):
                         raise Exception(str(e))
 
                 else:
-                    # Validate local path exists
-                    if not os.path.exists(custom_path):
+                    # Validate local path exists and is a file, with one stat
+                    try:
+                        st = os.stat(custom_path)
+                    except FileNotFoundError:
                         raise Exception(
                             ErrorMessages.CUSTOM_ISO_PATH_NOT_EXIST_TEMPLATE.format(
                                 path=custom_path
                             )
                         )
-                    if not os.path.isfile(custom_path):
+                    if not stat.S_ISREG(st.st_mode):
                         raise Exception(
                             ErrorMessages.CUSTOM_ISO_NOT_FILE_TEMPLATE.format(path=custom_path)
                         )
@@ -1452,7 +1651,19 @@ class InstallVMModal(BaseModal[str | None]):
                 # 2. Upload
                 progress_cb(StaticText.UPLOADING_ISO, 40)
 
+                last_upload_tick = [0.0, None]  # monotonic time, percent
+
                 def upload_progress(p):
+                    # Called for every uploaded chunk: repeats of the shown
+                    # percent and ticks closer than the update interval are
+                    # dropped, the start and the end are always shown
+                    now = time.monotonic()
+                    if p not in (0, 100) and (
+                        p == last_upload_tick[1]
+                        or now - last_upload_tick[0] < PROGRESS_UPDATE_INTERVAL
+                    ):
+                        return
+                    last_upload_tick[:] = [now, p]
                     progress_cb(
                         StaticText.UPLOADING_PROGRESS_TEMPLATE.format(progress=p), 40 + int(p * 0.4)
                     )
@@ -1472,6 +1683,8 @@ class InstallVMModal(BaseModal[str | None]):
                     uuid = domain.UUIDString()
 
                     def push_details():
+                        from .vmdetails_modals import VMDetailModal
+
                         app = self.app
                         # Close the install modal
                         self.dismiss()
@@ -1546,12 +1759,12 @@ class InstallVMModal(BaseModal[str | None]):
                 if automation_template_id:
                     # Get user configuration values
                     try:
-                        root_password = self.query_one("#automation-root-password", Input).value
-                        hostname = self.query_one("#automation-hostname", Input).value
-                        username = self.query_one("#automation-username", Input).value
-                        user_password = self.query_one("#automation-user-password", Input).value
-                        language = self.query_one("#automation-language", Select).value
-                        keyboard = self.query_one("#automation-keyboard", Select).value
+                        root_password = self._widgets["automation-root-password"].value
+                        hostname = self._widgets["automation-hostname"].value
+                        username = self._widgets["automation-username"].value
+                        user_password = self._widgets["automation-user-password"].value
+                        language = self._widgets["automation-language"].value
+                        keyboard = self._widgets["automation-keyboard"].value
 
                         # Add SCC info from user config if present
                         config = load_config()
@@ -1599,6 +1812,7 @@ class InstallVMModal(BaseModal[str | None]):
                     network_name=network_name,
                 )
             finally:
+                self.app.call_from_thread(self._stop_progress_flush)
                 self.app.call_from_thread(self.app.vm_service.resume_global_updates)
                 self.app.call_from_thread(self.app.vm_service.invalidate_domain_cache)
                 # Manually trigger a refresh as we suppressed the events
@@ -1671,6 +1885,7 @@ class InstallVMModal(BaseModal[str | None]):
                 except Exception as cleanup_error:
                     logging.warning(f"Failed to cleanup downloaded ISO: {cleanup_error}")
 
+            self.app.call_from_thread(self._stop_progress_flush)
             self.app.call_from_thread(
                 self.app.show_error_message,
                 ErrorMessages.PROVISIONING_FAILED_TEMPLATE.format(error=e),
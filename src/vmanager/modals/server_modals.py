@@ -13,7 +13,6 @@ from ..config import save_config
 from ..constants import ButtonLabels, ErrorMessages, StaticText, SuccessMessages
 from ..vmcard import ConfirmationDialog
 from .base_modals import BaseModal
-from .howto_ssh_modal import HowToSSHModal
 
 VALID_URI_PREFIXES = ("qemu:///", "qemu+ssh://")
 
@@ -295,6 +294,8 @@ class ServerManagementModal(BaseModal[str | None]):
             self.app.push_screen(ConnectionModal(), connection_callback)
 
         elif event.button.id == "ssh-help-btn":
+            from .howto_modals import HowToSSHModal
+
             self.app.push_screen(HowToSSHModal())
 
     def action_close_modal(self) -> None:
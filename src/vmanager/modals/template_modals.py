@@ -197,6 +197,8 @@ class TemplateManagementModal(BaseModal[bool]):
 
     def on_mount(self):
         """Called when modal is mounted - load and display templates."""
+        # Rescan on open, to pick up templates changed outside the application
+        self.template_manager.invalidate_templates_cache()
         self._load_templates()
 
     def _load_templates(self):
@@ -233,7 +235,7 @@ class TemplateManagementModal(BaseModal[bool]):
                         key=row_key,
                     )
 
-            logging.info(f"Loaded {len(self.templates)} templates")
+            logging.debug("Loaded %d templates", len(self.templates))
 
         except Exception as e:
             logging.error(f"Error loading templates: {e}")
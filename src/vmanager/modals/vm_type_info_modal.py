@@ -2,13 +2,10 @@
 Modal to show VM Type differences from DEFAULT_SETTINGS.md.
 """
 
-from textual import on
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer
-from textual.widgets import Button, Markdown
 
-from ..constants import ButtonLabels
-from .base_modals import BaseModal
+from .base_modals import CloseOnButtonModal, StaticMarkdown, close_button
 
 VM_TYPE_INFO_TEXT = """
 | [Storage Settings](https://www.qemu.org/docs/master/system/qemu-block-drivers.html) | Secure VM | Computation | Desktop (Linux) | Low Resource | Windows | Win Legacy | Server |
@@ -53,15 +50,10 @@ VM_TYPE_INFO_TEXT = """
 """
 
 
-class VMTypeInfoModal(BaseModal[None]):
+class VMTypeInfoModal(CloseOnButtonModal[None]):
     """A modal to display instructions for VM Types."""
 
     def compose(self) -> ComposeResult:
         with ScrollableContainer(id="howto-vmtype-dialog", classes="howto-dialog"):
-            yield Markdown(VM_TYPE_INFO_TEXT, id="howto-vmtype-markdown")
-            yield Button(ButtonLabels.CLOSE, id="close-btn", variant="primary")
-
-    @on(Button.Pressed)
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses."""
-        self.dismiss()
+            yield StaticMarkdown(VM_TYPE_INFO_TEXT, id="howto-vmtype-markdown")
+            yield close_button()
@@ -128,8 +128,6 @@ from .cpu_mem_pc_modals import (
     SelectMachineTypeModal,
 )
 from .disk_pool_modals import AddDiskModal, EditDiskModal, SelectDiskModal, SelectPoolModal
-from .howto_disk_modal import HowToDiskModal
-from .howto_virtiofs_modal import HowToVirtIOFSModal
 from .input_modals import AddChannelModal, AddInputDeviceModal, AddWatchdogModal
 from .network_modals import AddEditNetworkInterfaceModal
 from .utils_modals import ConfirmationDialog, FileSelectionModal, ProgressModal
@@ -3002,6 +3000,8 @@ class VMDetailModal(ModalScreen):
     def _handle_virtiofs_button(self, button_id):
         """Handle VirtIO-FS related button presses."""
         if button_id == "detail_virtiofs_help":
+            from .howto_modals import HowToVirtIOFSModal
+
             self.app.push_screen(HowToVirtIOFSModal())
 
         elif button_id == "add-virtiofs-btn":
@@ -3561,6 +3561,8 @@ class VMDetailModal(ModalScreen):
             )
 
         elif button_id == "detail_disk_help":
+            from .howto_modals import HowToDiskModal
+
             self.app.push_screen(HowToDiskModal())
 
     # --- Button ID to handler group mapping ---
@@ -6,6 +6,7 @@ along with common data structures for OS types and versions.
 """
 import base64
 import hashlib
+import json
 import logging
 import os
 import re
@@ -13,6 +14,7 @@ import secrets
 import ssl
 import subprocess
 import string
+import urllib.error
 import urllib.request
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
@@ -24,6 +26,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+from ..constants import AppInfo
+
+# Parsed ISO directory listings, revalidated with the server ETag / Last-Modified
+ISO_LIST_CACHE_DIR = Path.home() / ".cache" / AppInfo.name / "iso-lists"
+ISO_LIST_CACHE_VERSION = 1
+
 
 class OSType(Enum):
     """Supported operating system types."""
@@ -271,13 +279,34 @@ class OSProvider(ABC):
                     res["name"] = f"{name_prefix}{res['name']}"
             return results
 
-        logging.info(f"Fetching ISO list from {url}")
+        logging.info("Fetching ISO list from %s", url)
+
+        cache_file = ISO_LIST_CACHE_DIR / (
+            hashlib.sha1(f"{url}|{name_prefix}|{arch}|{filter_pattern}".encode()).hexdigest()
+            + ".json"
+        )
+        cached = self._read_iso_list_cache(cache_file)
 
         try:
+            request = urllib.request.Request(url)
+            if cached:
+                if cached.get("etag"):
+                    request.add_header("If-None-Match", cached["etag"])
+                if cached.get("last_modified"):
+                    request.add_header("If-Modified-Since", cached["last_modified"])
+
             # Use unverified context for compatibility
             context = ssl._create_unverified_context()
-            with urllib.request.urlopen(url, context=context, timeout=10) as response:
-                content = response.read().decode("utf-8")
+            try:
+                with urllib.request.urlopen(request, context=context, timeout=10) as response:
+                    content = response.read().decode("utf-8")
+                    etag = response.getheader("ETag")
+                    last_modified = response.getheader("Last-Modified")
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and cached:
+                    logging.debug("ISO list of %s not modified, using cached copy", url)
+                    return cached["isos"]
+                raise
 
             # Parse HTML to find ISO files
             links = re.findall(filter_pattern, content)
@@ -308,8 +337,51 @@ class OSProvider(ABC):
                         continue
 
             results.sort(key=lambda x: x["name"], reverse=True)
+            # Don't let a transient HEAD failure be replayed on every 304
+            complete = len(results) == len(unique_urls) and all(
+                res["size"] != "Unknown" and res["date"] for res in results
+            )
+            if complete and (etag or last_modified):
+                self._write_iso_list_cache(
+                    cache_file,
+                    {
+                        "version": ISO_LIST_CACHE_VERSION,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "isos": results,
+                    },
+                )
             return results
 
         except Exception as e:
-            logging.error(f"Error fetching ISO list from {url}: {e}")
+            logging.error("Error fetching ISO list from %s: %s", url, e)
             return []
+
+    @staticmethod
+    def _read_iso_list_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Return a cached ISO listing with its validators, or None."""
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != ISO_LIST_CACHE_VERSION
+            or not isinstance(cached.get("isos"), list)
+        ):
+            return None
+        return cached
+
+    @staticmethod
+    def _write_iso_list_cache(cache_file: Path, data: Dict[str, Any]) -> None:
+        """Persist an ISO listing atomically; failures only cost a future re-parse."""
+        try:
+            payload = json.dumps(data)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError) as e:
+            logging.warning("Could not write ISO list cache %s: %s", cache_file, e)
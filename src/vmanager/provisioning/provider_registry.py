@@ -22,10 +22,10 @@ class ProviderRegistry:
         """Register an OS provider."""
         os_type = provider.os_type
         if os_type in self._providers:
-            self._logger.warning(f"Overriding existing provider for {os_type.value}")
+            self._logger.warning("Overriding existing provider for %s", os_type.value)
 
         self._providers[os_type] = provider
-        self._logger.info(f"Registered provider for {os_type.value}")
+        self._logger.debug("Registered provider for %s", os_type.value)
 
     def get_provider(self, os_type: OSType) -> Optional[OSProvider]:
         """Get provider for a specific OS type."""
@@ -569,7 +569,7 @@ class OpenSUSEProvider(OSProvider):
         if not base_url:
             return []
 
-        self.logger.info(f"Fetching ISO list from {base_url} for arch {self.host_arch}")
+        self.logger.info("Fetching ISO list from %s for arch %s", base_url, self.host_arch)
 
         iso_urls = []
 
@@ -611,7 +611,7 @@ class OpenSUSEProvider(OSProvider):
             return unique_isos
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch ISO list: {e}")
+            self.logger.error("Failed to fetch ISO list: %s", e)
             return []
 
     def _generate_autoyast_xml(
@@ -669,24 +669,27 @@ class OpenSUSEProvider(OSProvider):
 
     def get_cached_isos(self) -> List[Dict[str, Any]]:
         """Retrieve a list of ISOs already present in the local cache directory."""
-        if not self.iso_cache.exists():
-            return []
-
         isos = []
         try:
-            for f in self.iso_cache.glob("*.iso"):
-                # Use stats for date
-                mtime = f.stat().st_mtime
-                dt_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-                isos.append(
-                    {
-                        "name": f.name,
-                        "url": f.name,  # Use filename as URL for local detection logic
-                        "date": f"{dt_str} (Cached)",
-                    }
-                )
+            # The file type comes with the directory scan, only the date needs a stat
+            with os.scandir(self.iso_cache) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".iso") or not entry.is_file():
+                        continue
+                    dt_str = datetime.fromtimestamp(entry.stat().st_mtime).strftime(
+                        "%Y-%m-%d %H:%M"
+                    )
+                    isos.append(
+                        {
+                            "name": entry.name,
+                            "url": entry.name,  # Use filename as URL for local detection logic
+                            "date": f"{dt_str} (Cached)",
+                        }
+                    )
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            self.logger.error(f"Error reading cached ISOs: {e}")
+            self.logger.error("Error reading cached ISOs: %s", e)
 
         return isos
 
@@ -44,6 +44,8 @@ class AutoYaSTTemplateManager:
         """
         self.provisioner = provisioner
         self.logger = logging.getLogger(__name__)
+        # Result of get_all_templates, until a template is saved or deleted
+        self._templates_cache: list[dict] | None = None
 
     # -------------------------------------------------------------------------
     # Template Discovery
@@ -53,6 +55,9 @@ class AutoYaSTTemplateManager:
         """
         Get all available templates (built-in and user templates).
 
+        The template directories are scanned once; later calls return the
+        same list until invalidate_templates_cache() is called.
+
         Returns:
             List of template dicts with keys:
             - filename: Template identifier
@@ -63,12 +68,19 @@ class AutoYaSTTemplateManager:
             - type: "built-in" or "user"
             - template_id: UUID for user templates
         """
-        templates = []
-        templates.extend(self.get_builtin_templates())
-        templates.extend(self.get_user_templates())
-        templates.sort(key=lambda x: (x["type"] != "built-in", x["display_name"]))
+        if self._templates_cache is None:
+            templates = []
+            templates.extend(self.get_builtin_templates())
+            templates.extend(self.get_user_templates())
+            templates.sort(key=lambda x: (x["type"] != "built-in", x["display_name"]))
+            self._templates_cache = templates
 
-        return templates
+        # Copy so callers filtering the list cannot alter the cache
+        return list(self._templates_cache)
+
+    def invalidate_templates_cache(self) -> None:
+        """Forget the cached template list, the next get_all_templates() scans again."""
+        self._templates_cache = None
 
     def get_builtin_templates(self) -> list[dict]:
         """
@@ -343,6 +355,7 @@ class AutoYaSTTemplateManager:
             with open(meta_file, "w", encoding="utf-8") as f:
                 json.dump(meta_data, f, indent=2)
 
+            self.invalidate_templates_cache()
             self.logger.info(f"Saved template '{name}' to {template_path}")
             return True, str(template_path)
 
@@ -375,6 +388,7 @@ class AutoYaSTTemplateManager:
                 if meta_file.exists():
                     meta_file.unlink()
 
+                self.invalidate_templates_cache()
                 self.logger.info(f"Deleted template {template_path}")
                 return True
 
@@ -821,7 +821,7 @@ def get_ssh_host_from_uri(uri: str) -> Optional[str]:
         return None
 
 
-@lru_cache(maxsize=16)
+@lru_cache(maxsize=256)
 def extract_server_name_from_uri(server_name: str) -> str:
     """
     Extract server name from URI for display.
@@ -2,9 +2,11 @@
 Library for VM creation and provisioning, supporting multiple Linux distributions.
 """
 
+import ctypes.util
 import hashlib
 import logging
 import os
+import platform
 import re
 import shutil
 import socket
@@ -48,9 +50,39 @@ from .storage_manager import create_volume
 from .vm_actions import strip_installation_assets, get_vm_boot_files, delete_boot_files
 from .utils import (
     get_ssh_host_from_uri,
+    is_remote_connection,
     manage_firewalld_port,
 )
 
+# Oldest libvirt (6.3.0), QEMU (5.0.0) and kernel (5.1) supporting io_uring disks
+IO_URING_MIN_LIBVIRT_VERSION = 6003000
+IO_URING_MIN_QEMU_VERSION = 5000000
+IO_URING_MIN_KERNEL = (5, 1)
+
+# Kernel switch restricting (1) or disabling (2) io_uring, absent before 6.6
+IO_URING_DISABLED_SYSCTL = "/proc/sys/kernel/io_uring_disabled"
+
+# Bytes read at a time when computing the checksum of an ISO image
+ISO_CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Bytes sent at a time when uploading a file to a storage pool
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Mentions of io_uring in libvirt and QEMU errors ("io_uring", "io uring")
+_IO_URING_ERROR_RE = re.compile(r"io[_ ]?uring", re.IGNORECASE)
+
+# ISO links of an HTML directory listing
+_ISO_HREF_RE = re.compile(r'href="([^"]*\.iso)"', re.IGNORECASE)
+
+
+def _io_uring_disabled() -> bool:
+    """Return True if the local kernel restricts or disables io_uring."""
+    try:
+        with open(IO_URING_DISABLED_SYSCTL, encoding="utf-8") as f:
+            return f.read().strip() != "0"
+    except OSError:
+        return False
+
 
 class VMType(Enum):
     SECURE = StaticText.VM_TYPE_SECURE
@@ -67,6 +99,7 @@ class VMProvisioner:
         self.conn = conn
         self.host_arch = get_host_architecture(conn)
         self.logger = logging.getLogger(__name__)
+        self._disk_io_mode = None
 
         # Initialize provider registry and register OS providers
         self.provider_registry = ProviderRegistry()
@@ -167,7 +200,7 @@ class VMProvisioner:
         if provider and hasattr(provider, "get_cached_isos"):
             return provider.get_cached_isos()
 
-        logging.info(f"Provider for {os_type} does not support cached ISOs, returning empty list")
+        logging.info("Provider for %s does not support cached ISOs, returning empty list", os_type)
         return []
 
     def get_iso_list(self, distro) -> List[Dict[str, Any]]:
@@ -241,7 +274,7 @@ class VMProvisioner:
             return self.get_iso_list_from_url(distro)
 
         else:
-            logging.warning(f"Unknown distribution type: {type(distro)}")
+            logging.warning("Unknown distribution type: %s", type(distro))
             return []
 
     def get_iso_list_from_url(self, url: str) -> List[Dict[str, Any]]:
@@ -291,24 +324,27 @@ class VMProvisioner:
             config.get("ISO_DOWNLOAD_PATH", str(Path.home() / ".cache" / AppInfo.name / "isos"))
         )
 
-        if not iso_cache_dir.exists():
-            return []
-
         isos = []
         try:
-            for f in iso_cache_dir.glob("*.iso"):
-                # Use stats for date
-                mtime = f.stat().st_mtime
-                dt_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-                isos.append(
-                    {
-                        "name": f.name,
-                        "url": f.name,  # Use filename as URL for local detection logic
-                        "date": f"{dt_str} (Cached)",
-                    }
-                )
+            # The file type comes with the directory scan, only the date needs a stat
+            with os.scandir(iso_cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".iso") or not entry.is_file():
+                        continue
+                    dt_str = datetime.fromtimestamp(entry.stat().st_mtime).strftime(
+                        "%Y-%m-%d %H:%M"
+                    )
+                    isos.append(
+                        {
+                            "name": entry.name,
+                            "url": entry.name,  # Use filename as URL for local detection logic
+                            "date": f"{dt_str} (Cached)",
+                        }
+                    )
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            logging.error(f"Error reading cached ISOs: {e}")
+            logging.error("Error reading cached ISOs: %s", e)
 
         return isos
 
@@ -323,7 +359,7 @@ class VMProvisioner:
         try:
             path_obj = Path(path)
             if not path_obj.exists() or not path_obj.is_dir():
-                logging.warning(f"Local path {path} does not exist or is not a directory.")
+                logging.warning("Local path %s does not exist or is not a directory.", path)
                 return []
 
             for f in path_obj.glob("*.iso"):
@@ -332,11 +368,11 @@ class VMProvisioner:
                     dt_str = datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M")
                     results.append({"name": f.name, "url": str(f.absolute()), "date": dt_str})
                 except Exception as e:
-                    logging.warning(f"Error reading file {f}: {e}")
+                    logging.warning("Error reading file %s: %s", f, e)
 
             results.sort(key=lambda x: x["name"], reverse=True)
         except Exception as e:
-            logging.error(f"Error listing local ISOs from {path}: {e}")
+            logging.error("Error listing local ISOs from %s: %s", path, e)
 
         return results
 
@@ -353,39 +389,39 @@ class VMProvisioner:
             with urllib.request.urlopen(url, context=context) as response:
                 html_content = response.read().decode("utf-8")
 
-                # Extract ISO links from HTML directory listing
-                iso_pattern = re.compile(r'href="([^"]*\.iso)"', re.IGNORECASE)
-                iso_matches = iso_pattern.findall(html_content)
+            # Extract ISO links from HTML directory listing, once the
+            # connection is released
+            iso_matches = _ISO_HREF_RE.findall(html_content)
 
-                if not iso_matches:
-                    logging.info(f"No ISO files found in directory listing at {url}")
-                    return []
+            if not iso_matches:
+                logging.info("No ISO files found in directory listing at %s", url)
+                return []
 
-                # Filter architecture if possible and remove duplicates
-                unique_isos = list(set(iso_matches))
+            # Filter architecture if possible and remove duplicates
+            unique_isos = list(set(iso_matches))
 
-                # Get details for each ISO with parallel requests
-                with ThreadPoolExecutor(max_workers=5) as executor:
-                    iso_details = list(
-                        executor.map(
-                            lambda iso_name: self._get_iso_details(url, iso_name), unique_isos
-                        )
+            # Get details for each ISO with parallel requests
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                iso_details = list(
+                    executor.map(
+                        lambda iso_name: self._get_iso_details(url, iso_name), unique_isos
                     )
+                )
 
-                # Filter out None results and add to results
-                for detail in iso_details:
-                    if detail:
-                        results.append(detail)
+            # Filter out None results and add to results
+            for detail in iso_details:
+                if detail:
+                    results.append(detail)
 
-                # Sort by name (newest first, typically)
-                results.sort(key=lambda x: x["name"], reverse=True)
+            # Sort by name (newest first, typically)
+            results.sort(key=lambda x: x["name"], reverse=True)
 
         except urllib.error.HTTPError as e:
-            logging.error(f"HTTP error accessing {url}: {e.code} - {e.reason}")
+            logging.error("HTTP error accessing %s: %s - %s", url, e.code, e.reason)
         except urllib.error.URLError as e:
-            logging.error(f"URL error accessing {url}: {e.reason}")
+            logging.error("URL error accessing %s: %s", url, e.reason)
         except Exception as e:
-            logging.error(f"Error fetching remote ISO list from {url}: {e}")
+            logging.error("Error fetching remote ISO list from %s: %s", url, e)
 
         return results
 
@@ -430,7 +466,7 @@ class VMProvisioner:
                 return {"name": clean_iso_name, "url": iso_url, "date": date_str}
 
         except Exception as e:
-            logging.warning(f"Failed to get details for {iso_name}: {e}")
+            logging.warning("Failed to get details for %s: %s", iso_name, e)
             # Clean the ISO name and return basic info even if we can't get details
             clean_iso_name = iso_name.lstrip("./")
             iso_url = f"{base_url.rstrip('/')}/{clean_iso_name}"
@@ -646,13 +682,17 @@ class VMProvisioner:
             try:
                 vol.upload(stream, 0, file_size)
 
-                with open(local_path, "rb") as f:
+                # The next chunk is read from disk while the current one is
+                # sent, so the upload does not wait on both in turn
+                with open(local_path, "rb") as f, ThreadPoolExecutor(max_workers=1) as reader:
                     uploaded = 0
                     chunk_count = 0
+                    next_data = reader.submit(f.read, UPLOAD_CHUNK_SIZE)
                     while True:
-                        data = f.read(1024 * 1024)  # 1MB chunk
+                        data = next_data.result()
                         if not data:
                             break
+                        next_data = reader.submit(f.read, UPLOAD_CHUNK_SIZE)
                         stream.send(data)
                         uploaded += len(data)
                         chunk_count += 1
@@ -699,10 +739,19 @@ class VMProvisioner:
         if not os.path.exists(local_path):
             return False
 
-        sha256_hash = hashlib.sha256()
         with open(local_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            if hasattr(hashlib, "file_digest"):  # Python >= 3.11
+                sha256_hash = hashlib.file_digest(f, hashlib.sha256)
+            else:
+                sha256_hash = hashlib.sha256()
+                # One buffer reused for the whole file instead of a new bytes per read
+                buffer = bytearray(ISO_CHECKSUM_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    sha256_hash.update(view[:size])
 
         calculated_checksum = sha256_hash.hexdigest()
         logging.info(f"Calculated checksum for {local_path}: {calculated_checksum}")
@@ -976,6 +1025,52 @@ class VMProvisioner:
 
         return None
 
+    def _get_disk_io_mode(self) -> str:
+        """
+        Returns the disk I/O backend of new VMs: io_uring when the hypervisor
+        host can use it, else the QEMU thread pool. Only checked for local
+        connections, where the kernel and liburing can be inspected.
+        """
+        if self._disk_io_mode is None:
+            self._disk_io_mode = "threads"
+            try:
+                kernel = tuple(int(n) for n in re.findall(r"\d+", platform.release())[:2])
+                if (
+                    not is_remote_connection(self.conn.getURI())
+                    and self.conn.getLibVersion() >= IO_URING_MIN_LIBVIRT_VERSION
+                    and self.conn.getVersion() >= IO_URING_MIN_QEMU_VERSION
+                    and kernel >= IO_URING_MIN_KERNEL
+                    and not _io_uring_disabled()
+                    and ctypes.util.find_library("uring")
+                ):
+                    self._disk_io_mode = "io_uring"
+            except Exception as e:
+                logging.debug("Could not check io_uring support, using threads: %s", e)
+        return self._disk_io_mode
+
+    def _define_domain(self, xml_desc: str, start: bool) -> libvirt.virDomain:
+        """
+        Defines (and optionally starts) a domain. If an io_uring disk is
+        rejected, as by QEMU builds without io_uring, the domain is defined
+        again with the thread pool backend, which is then kept for later VMs.
+        Errors that do not mention io_uring are raised as they are.
+        """
+        io_uring_driver = "io='io_uring'"
+        try:
+            dom = self.conn.defineXML(xml_desc)
+            if start:
+                dom.create()
+            return dom
+        except libvirt.libvirtError as e:
+            if io_uring_driver not in xml_desc or not _IO_URING_ERROR_RE.search(str(e)):
+                raise
+            logging.warning("io_uring disk rejected, retrying with io='threads': %s", e)
+        self._disk_io_mode = "threads"
+        dom = self.conn.defineXML(xml_desc.replace(io_uring_driver, "io='threads'"))
+        if start:
+            dom.create()
+        return dom
+
     def _get_vm_settings(
         self,
         vm_type: VMType,
@@ -1148,6 +1243,8 @@ class VMProvisioner:
         if disk_format:
             settings["disk_format"] = disk_format
 
+        settings["disk_io"] = self._get_disk_io_mode()
+
         # Alpine Linux (especially virt ISO) only supports virtio-net
         if os_type == OSType.ALPINE:
             settings["network_model"] = "virtio"
@@ -1422,7 +1519,8 @@ class VMProvisioner:
         # Disk
         xml += f"""
     <disk type='file' device='disk'>
-      <driver name='qemu' type='{settings["disk_format"]}' cache='{settings["disk_cache"]}'/>
+      <driver name='qemu' type='{settings["disk_format"]}' cache='{settings["disk_cache"]}'
+              io='{settings["disk_io"]}'/>
       <source file='{disk_path}'/>
       <target dev='vda' bus='{settings["disk_bus"]}'/>
       <boot order='{hd_boot}'/>
@@ -2735,7 +2833,7 @@ class VMProvisioner:
 
             # Define the VM
             report(StaticText.PROVISIONING_DEFINING_VM, 85)
-            dom = self.conn.defineXML(xml_desc)
+            dom = self._define_domain(xml_desc, start=False)
 
             # Show the configuration in a modal if callback is provided
             if show_config_modal_callback:
@@ -2890,8 +2988,7 @@ class VMProvisioner:
         )
 
         report(StaticText.PROVISIONING_CONFIGURING_VM_XML, 90)
-        dom = self.conn.defineXML(xml_desc)
-        dom.create()
+        dom = self._define_domain(xml_desc, start=True)
 
         # After starting the VM for installation, immediately strip the persistent
         # configuration of installation assets (kernel/initrd/cmdline/floppy)
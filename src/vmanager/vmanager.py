@@ -10,7 +10,6 @@ import re
 import signal
 import sys
 import threading
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from threading import RLock
 from typing import Any, Callable
@@ -407,7 +406,8 @@ class VMManagerTUI(App):
     def _trigger_host_stats_refresh(self):
         """Triggers a refresh of host statistics, cancelling any existing refresh."""
         # Show host stats
-        self.host_stats.styles.display = "block"
+        if self.host_stats.styles.display != "block":
+            self.host_stats.styles.display = "block"
 
         # Reset hide timer
         if self._hide_stats_timer:
@@ -1162,16 +1162,8 @@ class VMManagerTUI(App):
 
     @on(Button.Pressed, "#view_log_button")
     def action_view_log(self) -> None:
-        """View the application log file (last 1000 lines)."""
-        log_path = get_log_path()
-        try:
-            with open(log_path) as f:
-                log_content = "".join(deque(f, 1000))
-        except FileNotFoundError:
-            log_content = ErrorMessages.LOG_FILE_NOT_FOUND.format(log_path=log_path)
-        except Exception as e:
-            log_content = ErrorMessages.ERROR_READING_LOG_FILE.format(error=e)
-        self.push_screen(LogModal(log_content))
+        """View the application log file, starting from its tail."""
+        self.push_screen(LogModal(log_path=str(get_log_path())))
 
     @on(Button.Pressed, "#server_preferences_button")
     def action_server_preferences(self) -> None:
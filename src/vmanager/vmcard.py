@@ -8,7 +8,6 @@ import os
 import subprocess
 import threading
 import time
-import traceback
 from functools import partial
 from urllib.parse import urlparse
 
@@ -44,7 +43,6 @@ from .events import (
     VMSelectionChanged,
 )
 from .modals.disk_pool_modals import SelectDiskModal
-from .modals.howto_overlay_modal import HowToOverlayModal
 from .modals.input_modals import InputModal, _sanitize_input
 from .modals.migration_modals import MigrationModal
 from .modals.utils_modals import ConfirmationDialog, LoadingModal, ProgressModal
@@ -1307,6 +1305,8 @@ class VMCard(Static):
 
     def _handle_overlay_help(self) -> None:
         """Handles the overlay help button press."""
+        from .modals.howto_modals import HowToOverlayModal
+
         self.app.push_screen(HowToOverlayModal())
 
     def _handle_create_overlay(self) -> None:
@@ -1632,7 +1632,7 @@ class VMCard(Static):
             self.app.show_error_message(
                 ErrorMessages.UNEXPECTED_ERROR_OCCURRED_TEMPLATE.format(error=e)
             )
-            logging.error(f"Unexpected error handling XML button: {traceback.format_exc()}")
+            logging.exception("Unexpected error handling XML button")
 
     def _handle_connect_button(self) -> None:
         """Handles the connect button press by running the remove virt viewer in a worker."""
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+# Add the src directory to the path to import vmanager modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from vmanager.modals.input_modals import _sanitize_domain_name, _sanitize_input
+
+
+class TestSanitizeInput(unittest.TestCase):
+    def test_valid_input_unchanged(self):
+        """Allowed characters are kept and not reported as modified."""
+        self.assertEqual(_sanitize_input("vm-01_test.img"), ("vm-01_test.img", False))
+
+    def test_surrounding_whitespace_is_not_a_modification(self):
+        """Leading/trailing whitespace is stripped silently."""
+        self.assertEqual(_sanitize_input("  my_vm  "), ("my_vm", False))
+
+    def test_invalid_characters_removed(self):
+        """Spaces, punctuation and non-ASCII characters are removed."""
+        self.assertEqual(_sanitize_input("my vm/é€!1"), ("myvm1", True))
+
+    def test_empty_input(self):
+        """Empty input returns an empty string flagged as modified."""
+        self.assertEqual(_sanitize_input("   "), ("", True))
+
+    def test_too_long(self):
+        """Inputs longer than 64 characters after sanitizing are rejected."""
+        with self.assertRaises(ValueError):
+            _sanitize_input("a" * 65)
+
+
+class TestSanitizeDomainName(unittest.TestCase):
+    def test_valid_domain_unchanged(self):
+        """Alphanumerics, hyphens and periods are kept."""
+        self.assertEqual(_sanitize_domain_name("host-1.example.com"), ("host-1.example.com", False))
+
+    def test_underscore_removed(self):
+        """Underscores are not valid in domain names."""
+        self.assertEqual(_sanitize_domain_name("my_host"), ("myhost", True))
+
+    def test_non_ascii_removed(self):
+        """Non-ASCII letters and digits are dropped."""
+        self.assertEqual(_sanitize_domain_name("hôst١"), ("hst", True))
+
+    def test_too_long(self):
+        """Domain names longer than 64 characters are rejected."""
+        with self.assertRaises(ValueError):
+            _sanitize_domain_name("a" * 65)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -123,31 +123,29 @@ class TestVMProvisionerDownload(unittest.TestCase):
                 shutil.rmtree(temp_dir)
 
     @patch("vmanager.vm_provisioner.hashlib.sha256")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"iso content")
-    @patch("os.path.exists")
-    def test_validate_iso_match(self, mock_exists, mock_file, mock_sha):
+    def test_validate_iso_match(self, mock_sha):
         """Test ISO validation with matching checksum."""
-        mock_exists.return_value = True
+        with open(self.dest_path, "wb") as f:
+            f.write(b"iso content")
         
         # Mock sha256
         mock_sha_inst = mock_sha.return_value
         mock_sha_inst.hexdigest.return_value = "abcdef1234"
         
-        result = self.provisioner.validate_iso("/dummy/path.iso", "ABCDEF1234")
+        result = self.provisioner.validate_iso(self.dest_path, "ABCDEF1234")
         self.assertTrue(result)
 
     @patch("vmanager.vm_provisioner.hashlib.sha256")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"iso content")
-    @patch("os.path.exists")
-    def test_validate_iso_mismatch(self, mock_exists, mock_file, mock_sha):
+    def test_validate_iso_mismatch(self, mock_sha):
         """Test ISO validation with mismatching checksum."""
-        mock_exists.return_value = True
+        with open(self.dest_path, "wb") as f:
+            f.write(b"iso content")
         
         # Mock sha256
         mock_sha_inst = mock_sha.return_value
         mock_sha_inst.hexdigest.return_value = "abcdef1234"
         
-        result = self.provisioner.validate_iso("/dummy/path.iso", "wrong")
+        result = self.provisioner.validate_iso(self.dest_path, "wrong")
         self.assertFalse(result)
 
     @patch("os.path.exists")
@@ -447,6 +447,105 @@ class TestVMProvisionerNVRAM(unittest.TestCase):
         self.assertIn("type='vnc'", xml)
         self.assertNotIn("type='spice'", xml)
 
+    def _setup_io_uring_host(self, uri="qemu:///system"):
+        """Make the connection look like a host able to use io_uring."""
+        self.mock_conn.getURI.return_value = uri
+        self.mock_conn.getLibVersion.return_value = 10000000
+        self.mock_conn.getVersion.return_value = 8002000
+
+    def _generate_desktop_xml(self):
+        return self.provisioner.generate_xml(
+            vm_name="iovm",
+            vm_type=VMType.DESKTOP,
+            disk_path="/path/to/disk",
+            iso_path="/path/to/iso",
+        )
+
+    @patch("vmanager.vm_provisioner.ctypes.util.find_library", return_value="liburing.so.2")
+    @patch("vmanager.vm_provisioner._io_uring_disabled", return_value=False)
+    @patch("vmanager.vm_provisioner.platform.release", return_value="6.8.0-1-default")
+    def test_generate_xml_disk_io_uring(self, mock_release, mock_disabled, mock_find):
+        """Test that the disk uses io_uring on a local host supporting it"""
+        self._setup_io_uring_host()
+        xml = self._generate_desktop_xml()
+        self.assertIn("io='io_uring'", xml)
+        self.assertNotIn("io='threads'", xml)
+
+    @patch("vmanager.vm_provisioner.ctypes.util.find_library", return_value="liburing.so.2")
+    @patch("vmanager.vm_provisioner._io_uring_disabled", return_value=True)
+    @patch("vmanager.vm_provisioner.platform.release", return_value="6.8.0-1-default")
+    def test_generate_xml_disk_io_threads_when_disabled(
+        self, mock_release, mock_disabled, mock_find
+    ):
+        """Test that the disk uses threads when io_uring is disabled by sysctl"""
+        self._setup_io_uring_host()
+        xml = self._generate_desktop_xml()
+        self.assertIn("io='threads'", xml)
+        self.assertNotIn("io='io_uring'", xml)
+
+    @patch("vmanager.vm_provisioner.ctypes.util.find_library", return_value=None)
+    @patch("vmanager.vm_provisioner._io_uring_disabled", return_value=False)
+    @patch("vmanager.vm_provisioner.platform.release", return_value="6.8.0-1-default")
+    def test_generate_xml_disk_io_threads_without_liburing(
+        self, mock_release, mock_disabled, mock_find
+    ):
+        """Test that the disk uses threads when liburing is not installed"""
+        self._setup_io_uring_host()
+        self.assertIn("io='threads'", self._generate_desktop_xml())
+
+    @patch("vmanager.vm_provisioner.ctypes.util.find_library", return_value="liburing.so.2")
+    @patch("vmanager.vm_provisioner._io_uring_disabled", return_value=False)
+    @patch("vmanager.vm_provisioner.platform.release", return_value="6.8.0-1-default")
+    def test_generate_xml_disk_io_threads_for_remote_host(
+        self, mock_release, mock_disabled, mock_find
+    ):
+        """Test that the disk uses threads on a remote connection"""
+        self._setup_io_uring_host(uri="qemu+ssh://root@remote.host/system")
+        self.assertIn("io='threads'", self._generate_desktop_xml())
+
+    @patch("vmanager.vm_provisioner.platform.release", return_value="4.18.0-553.el8")
+    def test_generate_xml_disk_io_threads_old_kernel(self, mock_release):
+        """Test that the disk uses threads on kernels older than 5.1"""
+        self._setup_io_uring_host()
+        self.assertIn("io='threads'", self._generate_desktop_xml())
+
+    def test_define_domain_falls_back_to_threads(self):
+        """Test that a rejected io_uring disk is defined again with threads"""
+        self.provisioner._disk_io_mode = "io_uring"
+        mock_dom = MagicMock()
+        mock_dom.create.side_effect = [libvirt.libvirtError("io_uring not supported"), 0]
+        self.mock_conn.defineXML.return_value = mock_dom
+
+        xml = "<domain><driver name='qemu' type='qcow2' cache='none' io='io_uring'/></domain>"
+        dom = self.provisioner._define_domain(xml, start=True)
+
+        self.assertIs(dom, mock_dom)
+        self.assertEqual(self.mock_conn.defineXML.call_count, 2)
+        retried_xml = self.mock_conn.defineXML.call_args_list[1][0][0]
+        self.assertIn("io='threads'", retried_xml)
+        self.assertNotIn("io='io_uring'", retried_xml)
+        self.assertEqual(self.provisioner._disk_io_mode, "threads")
+
+    def test_define_domain_threads_error_is_raised(self):
+        """Test that errors of a domain without io_uring are not retried"""
+        self.mock_conn.defineXML.side_effect = libvirt.libvirtError("invalid XML")
+        xml = "<domain><driver name='qemu' type='qcow2' cache='none' io='threads'/></domain>"
+        with self.assertRaises(libvirt.libvirtError):
+            self.provisioner._define_domain(xml, start=False)
+        self.assertEqual(self.mock_conn.defineXML.call_count, 1)
+
+    def test_define_domain_unrelated_error_is_raised(self):
+        """Test that errors unrelated to io_uring keep the io_uring mode"""
+        self.provisioner._disk_io_mode = "io_uring"
+        self.mock_conn.defineXML.side_effect = libvirt.libvirtError(
+            "operation failed: domain 'test-vm' already exists"
+        )
+        xml = "<domain><driver name='qemu' type='qcow2' cache='none' io='io_uring'/></domain>"
+        with self.assertRaises(libvirt.libvirtError):
+            self.provisioner._define_domain(xml, start=True)
+        self.assertEqual(self.mock_conn.defineXML.call_count, 1)
+        self.assertEqual(self.provisioner._disk_io_mode, "io_uring")
+
 
 if __name__ == "__main__":
     unittest.main()